@@ -63,6 +63,14 @@ ENVS = {
     PY38: {"coverage": True, "pkg_specs": {"pip": ">19"}},
 }
 
+# The python version of the `tests` session run by default locally. It is the coverage one, so that reports are built.
+MAIN_PYTHON = PY38
+
+# On CI run the whole matrix; locally, only the main python by default. Other versions can still be selected explicitly
+# with nox's own options, e.g. `nox -s tests` (whole matrix), `nox -s "tests(3.10)"` or `nox -s tests -p 3.10`.
+if not os.environ.get("CI"):
+    nox.options.sessions = [f"tests({MAIN_PYTHON})", "flake8", "docs"]
+
 ENV_PARAMS = tuple((k, v["coverage"], v["pkg_specs"]) for k, v in ENVS.items())
 ENV_IDS = tuple(ENVS.keys())
 
@@ -79,6 +87,9 @@ def tests(session, coverage, pkg_specs):
     rm_file(Folders.coverage_intermediate_file)
     rm_file(Folders.root / "coverage.xml")
 
+    # Keep the pytest cache so that previously failed tests run first, unless asked not to (nox -s tests -- --fresh)
+    pytest_cache_args = ("--cache-clear",) if "--fresh" in session.posargs else ("--failed-first",)
+
     # CI-only dependencies
     # Did we receive a flag through positional arguments ? (nox -s tests -- <flag>)
     # install_ci_deps = False
@@ -134,8 +145,9 @@ def tests(session, coverage, pkg_specs):
         # install self so that it is recognized by pytest
         session.install(".", "--no-deps")
 
-        # simple: pytest only
-        session.run("python", "-m", "pytest", "--cache-clear", "-v", "tests/")
+        # simple: pytest only, distributed on all cores
+        install_reqs(session, phase="tests-xdist", phase_reqs=["pytest-xdist"], versions_dct=pkg_specs)
+        session.run("python", "-m", "pytest", *pytest_cache_args, "-n", "auto", "-v", "tests/")
 
         # since our tests are too limited, we use our own mkdocs build as additional test for now.
         if cannot_run_mayavi:
@@ -153,12 +165,14 @@ def tests(session, coverage, pkg_specs):
 
         # coverage + junit html reports + badge generation
         install_reqs(session, phase="coverage",
-                             phase_reqs=["coverage", "pytest-html", "genbadge[tests,coverage]"],
+                             phase_reqs=["coverage", "pytest-cov", "pytest-xdist", "pytest-html",
+                                         "genbadge[tests,coverage]"],
                              versions_dct=pkg_specs)
 
-        # --coverage + junit html reports
-        session.run("coverage", "run", "--source", f"src/{pkg_name}",
-                    "-m", "pytest", "--cache-clear",
+        # --coverage + junit html reports, distributed on all cores. pytest-cov combines the per-worker data into the
+        # .coverage file, so that the doc builds below can append to it.
+        session.run("python", "-m", "pytest", *pytest_cache_args, "-n", "auto",
+                    f"--cov=src/{pkg_name}", "--cov-report=",
                     f"--junitxml={Folders.test_xml}", f"--html={Folders.test_html}",
                     "-v", "tests/")
 
@@ -300,12 +314,14 @@ def release(session):
         raise ValueError("You need to execute this action on a clean tag version with no local changes.")
 
     # Did we receive a token through positional arguments ? (nox -s release -- <token>)
-    if len(session.posargs) == 1:
+    posargs = session.posargs
+    nb_posargs = len(posargs)
+    if nb_posargs == 1:
         # Run from within github actions - no need to publish on pypi
-        gh_token = session.posargs[0]
+        gh_token = posargs[0]
         publish_on_pypi = False
 
-    elif len(session.posargs) == 0:
+    elif nb_posargs == 0:
         # Run from local commandline - assume we want to manually publish on PyPi
         publish_on_pypi = True
 
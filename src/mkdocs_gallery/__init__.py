@@ -20,11 +20,12 @@ except ImportError:
 
 
 base_path = os.path.dirname(os.path.abspath(__file__))
+_static_path = os.path.join(base_path, "static")
 
 
 def glr_path_static():
     """Returns path to packaged static files"""
-    return os.path.join(base_path, "static")
+    return _static_path
 
 
 __all__ = [
@@ -14,13 +14,15 @@ from __future__ import print_function, unicode_literals
 import ast
 import codecs
 import collections
-import inspect
 import os
 import re
+import sys
 import warnings
+from functools import lru_cache
 from html import escape
 from importlib import import_module
-from typing import Set
+from types import MethodType
+from typing import Dict, List, Set
 
 from . import mkdocs_compatibility
 from .errors import ExtensionError
@@ -41,6 +43,26 @@ class DummyClass(object):
         return "Property"
 
 
+def _get_attribute_name(node: ast.Attribute):
+    """Return the dotted name of an attribute chain such as `a.b.c`.
+
+    If the chain does not start with a name (e.g. `a().b`), return None and the node at the base of the chain (`a()`)
+    instead, so that it can be visited.
+    """
+    attrs = []
+    while isinstance(node, ast.Attribute):
+        attrs.append(node.attr)
+        node = node.value
+
+    if isinstance(node, ast.Name):
+        # This is a.b, not e.g. a().b
+        attrs.append(node.id)
+        return ".".join(reversed(attrs)), None
+    else:
+        # need to get a in a().b
+        return None, node
+
+
 class NameFinder(ast.NodeVisitor):
     """Finds the longest form of variable names and their imports in code.
 
@@ -53,6 +75,33 @@ class NameFinder(ast.NodeVisitor):
         self.global_variables = global_variables or {}
         self.accessed_names = set()
 
+    def visit(self, node):
+        """Visit `node` and its descendants.
+
+        Same as `ast.NodeVisitor.visit` but faster: nodes are dispatched on their exact type, and an explicit stack is
+        used instead of a recursive call per node. Nodes are still visited depth-first in source order, since the order
+        of imports matters.
+        """
+        accessed_names = self.accessed_names
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is ast.Name:
+                accessed_names.add(node.id)
+            elif node_type is ast.Attribute:
+                attr_name, base_node = _get_attribute_name(node)
+                if attr_name is not None:
+                    accessed_names.add(attr_name)
+                else:
+                    stack.append(base_node)
+            elif node_type is ast.Import:
+                self.visit_Import(node)
+            elif node_type is ast.ImportFrom:
+                self.visit_ImportFrom(node)
+            else:
+                stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
     def visit_Import(self, node, prefix=""):
         for alias in node.names:
             local_name = alias.asname or alias.name
@@ -65,29 +114,38 @@ class NameFinder(ast.NodeVisitor):
         self.accessed_names.add(node.id)
 
     def visit_Attribute(self, node):
-        attrs = []
-        while isinstance(node, ast.Attribute):
-            attrs.append(node.attr)
-            node = node.value
-
-        if isinstance(node, ast.Name):
-            # This is a.b, not e.g. a().b
-            attrs.append(node.id)
-            self.accessed_names.add(".".join(reversed(attrs)))
+        attr_name, base_node = _get_attribute_name(node)
+        if attr_name is not None:
+            self.accessed_names.add(attr_name)
         else:
-            # need to get a in a().b
-            self.visit(node)
+            self.visit(base_node)
 
     def get_mapping(self):
         options = list()
+        global_variables = self.global_variables
+        imported_names = self.imported_names
+
+        # The first part of all names that can be resolved. Note: imported names can be dotted, e.g. `import os.path`
+        resolvable_roots = {imported_name.split(".", 1)[0] for imported_name in imported_names}
+        resolvable_roots.update(global_variables)
+
         for name in self.accessed_names:
             local_name_split = name.split(".")
+            root = local_name_split[0]
+            if root not in resolvable_roots:
+                # Nothing to resolve (builtins, local variables...): skip
+                continue
+
+            # All the successive prefixes of the name: "a", "a.b", "a.b.c"...
+            local_names = [root]
+            for part in local_name_split[1:]:
+                local_names.append(local_names[-1] + "." + part)
+
             # first pass: by global variables and object inspection (preferred)
-            for split_level in range(len(local_name_split)):
-                local_name = ".".join(local_name_split[: split_level + 1])
-                remainder = name[len(local_name) :]
-                if local_name in self.global_variables:
-                    obj = self.global_variables[local_name]
+            for local_name in local_names:
+                if local_name in global_variables:
+                    obj = global_variables[local_name]
+                    remainder = name[len(local_name) :]
                     class_attr, method = False, []
                     if remainder:
                         for level in remainder[1:].split("."):
@@ -102,28 +160,31 @@ class NameFinder(ast.NodeVisitor):
                                 obj = getattr(obj, level)
                             except AttributeError:
                                 break
-                            if inspect.ismethod(obj):
+                            if isinstance(obj, MethodType):
                                 obj = last_obj
                                 class_attr, method = True, [level]
                                 break
                     del remainder
-                    is_class = inspect.isclass(obj)
+                    is_class = isinstance(obj, type)
                     if is_class or class_attr:
                         # Traverse all bases
                         classes = [obj if is_class else obj.__class__]
+                        # "object" as a base class is not very useful
+                        seen_classes = {classes[0], object}
                         offset = 0
                         while offset < len(classes):
                             for base in classes[offset].__bases__:
-                                # "object" as a base class is not very useful
-                                if base not in classes and base is not object:
+                                if base not in seen_classes:
+                                    seen_classes.add(base)
                                     classes.append(base)
                             offset += 1
                     else:
                         classes = [obj.__class__]
                     for cc in classes:
-                        module = inspect.getmodule(cc)
-                        if module is not None:
-                            module = module.__name__.split(".")
+                        # Note: same as `inspect.getmodule(cc)` for classes, but much faster
+                        module = getattr(cc, "__module__", None)
+                        if module is not None and module in sys.modules:
+                            module = module.split(".")
                             class_name = cc.__qualname__
                             # a.b.C.meth could be documented as a.C.meth,
                             # so go down the list
@@ -133,31 +194,47 @@ class NameFinder(ast.NodeVisitor):
             # second pass: by import (can't resolve as well without doing
             # some actions like actually importing the modules, so use it
             # as a last resort)
-            for split_level in range(len(local_name_split)):
-                local_name = ".".join(local_name_split[: split_level + 1])
-                remainder = name[len(local_name) :]
-                if local_name in self.imported_names:
-                    full_name = self.imported_names[local_name] + remainder
+            for local_name in local_names:
+                if local_name in imported_names:
+                    full_name = imported_names[local_name] + name[len(local_name) :]
                     is_class = class_attr = False  # can't tell without import
                     options.append((name, full_name, class_attr, is_class))
         return options
 
 
-def _from_import(a, b):
+# Sentinel returned by `_from_import_cached` when the import failed
+_IMPORT_FAILED = object()
+
+
+@lru_cache(maxsize=None)
+def _from_import_cached(a, b):
+    """Return `b` imported from module `a`, or `_IMPORT_FAILED`. Cached since the same names recur in all examples."""
     # imp_line = 'from %s import %s' % (a, b)
     # scope = dict()
     # with warnings.catch_warnings(record=True):  # swallow warnings
     #     warnings.simplefilter('ignore')
     #     exec(imp_line, scope, scope)
     # return scope
-    with warnings.catch_warnings(record=True):  # swallow warnings
-        warnings.simplefilter("ignore")
-        m = import_module(a)
-        obj = getattr(m, b)
+    try:
+        with warnings.catch_warnings(record=True):  # swallow warnings
+            warnings.simplefilter("ignore")
+            m = import_module(a)
+            obj = getattr(m, b)
+    except Exception:  # libraries can throw all sorts of exceptions...
+        return _IMPORT_FAILED
+
+    return obj
+
+
+def _from_import(a, b):
+    obj = _from_import_cached(a, b)
+    if obj is _IMPORT_FAILED:
+        raise ImportError(f"Could not import {b!r} from {a!r}")
 
     return obj
 
 
+@lru_cache(maxsize=None)
 def _get_short_module_name(module_name, obj_name):
     """Get the shortest possible module name."""
     if "." in obj_name:
@@ -191,7 +268,9 @@ def _get_short_module_name(module_name, obj_name):
     return short_name
 
 
-_regex = re.compile(r":(?:" r"func(?:tion)?|" r"meth(?:od)?|" r"attr(?:ibute)?|" r"obj(?:ect)?|" r"class):`~?(\S*)`")
+_regex = re.compile(
+    r":(?:" r"func(?:tion)?|" r"meth(?:od)?|" r"attr(?:ibute)?|" r"obj(?:ect)?|" r"class):`~?(\S*)`", re.ASCII
+)
 
 
 def identify_names(script_blocks, global_variables=None, node=""):
@@ -209,11 +288,19 @@ def identify_names(script_blocks, global_variables=None, node=""):
 
     # Get matches from docstring inspection
     text = "\n".join(txt for kind, txt, _ in script_blocks if kind == "text")
-    names.extend((x, x, False, False) for x in re.findall(_regex, text))
+    if ":" in text:
+        names.extend((x, x, False, False) for x in (m.group(1) for m in _regex.finditer(text)))
     example_code_obj = collections.OrderedDict()  # order is important
 
     # Make a list of all guesses, in `_embed_code_links` we will break when we find a match
-    for name, full_name, class_like, is_class in names:
+    # Note: the same guess can be produced several times (by inspection and by import, or by text and code): skip dups
+    seen = set()
+    for option in names:
+        if option in seen:
+            continue
+        seen.add(option)
+
+        name, full_name, class_like, is_class = option
         if name not in example_code_obj:
             example_code_obj[name] = list()
 
@@ -310,53 +397,59 @@ def _thumbnail_div(script_results: GalleryScriptResults, is_backref: bool = Fals
     )
 
 
-def _write_backreferences(backrefs: Set, seen_backrefs: Set, script_results: GalleryScriptResults):
+def _write_backreferences(backrefs: Set, seen_backrefs: Dict[str, List[str]], script_results: GalleryScriptResults):
     """
-    Write backreference file including a thumbnail list of examples.
+    Add the thumbnail of an example to the backreference contents of each of its backrefs.
+
+    Nothing is written to disk here: the contents are accumulated in `seen_backrefs` and written once per
+    backreference file by `_finalize_backreferences`.
 
     Parameters
     ----------
     backrefs : set
+        The backrefs (object full names) used in this example.
 
-    seen_backrefs : set
+    seen_backrefs : dict
+        The markdown parts accumulated so far, for each backref seen so far. Updated in-place.
 
     script_results : GalleryScriptResults
-
-    Returns
-    -------
-
+        The results from processing the example.
     """
-    all_info = script_results.script.gallery.all_info
+    if not backrefs:
+        return
+
+    # The thumbnail is the same for all backrefs
+    thumb_md = _thumbnail_div(script_results, is_backref=True)
 
     for backref in backrefs:
-        # Get the backref file to use for this module, according to config
-        include_path = _new_file(all_info.get_backreferences_file(backref))
-
-        # Create new or append to existing file
-        seen = backref in seen_backrefs
-        with codecs.open(str(include_path), "a" if seen else "w", encoding="utf-8") as ex_file:
-            # If first ref: write header
-            if not seen:
-                # Be aware that if the number of lines of this heading changes,
-                #   the minigallery directive should be modified accordingly
-                heading = "Examples using ``%s``" % backref
-                ex_file.write("\n\n" + heading + "\n")
-                ex_file.write("^" * len(heading) + "\n")
-
-            # Write the thumbnail
-            ex_file.write(_thumbnail_div(script_results, is_backref=True))
-            seen_backrefs.add(backref)
-
-
-def _finalize_backreferences(seen_backrefs, all_info: AllInformation):
-    """Replace backref files only if necessary."""
+        try:
+            parts = seen_backrefs[backref]
+        except KeyError:
+            # First ref: write header
+            # Be aware that if the number of lines of this heading changes,
+            #   the minigallery directive should be modified accordingly
+            heading = "Examples using ``%s``" % backref
+            parts = seen_backrefs[backref] = ["\n\n" + heading + "\n" + "^" * len(heading) + "\n"]
+
+        # Write the thumbnail
+        parts.append(thumb_md)
+
+
+def _finalize_backreferences(seen_backrefs: Dict[str, List[str]], all_info: AllInformation):
+    """Write the backref files, and replace the existing ones only if necessary."""
     logger = mkdocs_compatibility.getLogger("mkdocs-gallery")
     if all_info.gallery_conf["backreferences_dir"] is None:
         return
 
-    for backref in seen_backrefs:
-        # Get the backref file to use for this module, according to config
-        path = _new_file(all_info.get_backreferences_file(backref))
+    # Get the backref file to use for each module, according to config
+    paths = {backref: _new_file(all_info.get_backreferences_file(backref)) for backref in seen_backrefs}
+
+    # Write all files first (with the .new suffix), each in a single pass
+    for backref, path in paths.items():
+        with codecs.open(str(path), "w", encoding="utf-8") as ex_file:
+            ex_file.write("".join(seen_backrefs[backref]))
+
+    for path in paths.values():
         if path.exists():
             # Simply drop the .new suffix
             _replace_by_new_if_needed(path, md5_mode="t")
@@ -8,8 +8,9 @@ Binder utility functions
 """
 import os
 import shutil
-from pathlib import Path
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from urllib.parse import quote
 
 from tqdm import tqdm
@@ -20,6 +21,12 @@ from .gen_data_model import GalleryScript
 
 logger = mkdocs_compatibility.getLogger("mkdocs-gallery")
 
+# The binder badge logo, copied in the images dir of each gallery
+_BINDER_BADGE_SRC = os.path.join(glr_path_static(), "binder_badge_logo.svg")
+
+# Max number of threads used to copy the binder notebooks
+_BINDER_COPY_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def gen_binder_url(script: GalleryScript, binder_conf):
     """Generate a Binder URL according to the configuration in conf.py.
@@ -40,35 +47,40 @@ def gen_binder_url(script: GalleryScript, binder_conf):
     fpath_prefix = binder_conf.get("filepath_prefix")
     link_base = binder_conf.get("notebooks_dir")
 
-    # We want to keep the relative path to sub-folders
-    path_link = os.path.join(link_base, script.ipynb_file_rel_site_root.as_posix())
+    # We want to keep the relative path to sub-folders. Note: this is a posix path already, no need to fix slashes
+    path_link = script.ipynb_file_rel_site_root.as_posix()
+    if link_base:
+        path_link = f"{link_base.rstrip('/')}/{path_link}"
 
     # In case our website is hosted in a sub-folder
     if fpath_prefix is not None:
         path_link = "/".join([fpath_prefix.strip("/"), path_link])
 
-    # Make sure we have the right slashes (in case we're on Windows)
-    path_link = path_link.replace(os.path.sep, "/")
-
     # Create the URL
+    binder_url_base = _get_binder_url_base(
+        binderhub_url=binder_conf["binderhub_url"],
+        org=binder_conf["org"],
+        repo=binder_conf["repo"],
+        branch=binder_conf["branch"],
+        use_jupyter_lab=binder_conf.get("use_jupyter_lab", False) is True,
+    )
+    return binder_url_base + quote(path_link)
+
+
+@lru_cache(maxsize=None)
+def _get_binder_url_base(binderhub_url: str, org: str, repo: str, branch: str, use_jupyter_lab: bool) -> str:
+    """Return the part of the Binder URL that is common to all scripts, up to the (quoted) notebook path.
+
+    This is cached since it is the same for all scripts of a build.
+    """
     # See https://mybinder.org/ to check that it is still the right one
     # Note: the branch will typically be gh-pages
-    binder_url = "/".join(
-        [
-            binder_conf["binderhub_url"],
-            "v2",
-            "gh",
-            binder_conf["org"],
-            binder_conf["repo"],
-            quote(binder_conf["branch"]),
-        ]
-    )
+    binder_url = "/".join([binderhub_url, "v2", "gh", org, repo, quote(branch)])
 
-    if binder_conf.get("use_jupyter_lab", False) is True:
-        binder_url += "?urlpath=lab/tree/{}".format(quote(path_link))
+    if use_jupyter_lab:
+        return binder_url + "?urlpath=lab/tree/"
     else:
-        binder_url += "?filepath={}".format(quote(path_link))
-    return binder_url
+        return binder_url + "?filepath="
 
 
 def gen_binder_md(script: GalleryScript, binder_conf: Dict):
@@ -107,18 +119,34 @@ def gen_binder_md(script: GalleryScript, binder_conf: Dict):
     # And in any case, it does not work on Windows, so here we copy the SVG to `images` for each gallery and link to it
     # there. This will make a few copies, and there will be an extra in `_static` at the end of the build, but it at
     # least works...
-    physical_path = script.gallery.images_dir / "binder_badge_logo.svg"
-    if not physical_path.exists():
-        # Make sure parent dirs exists (this should not be necessary actually)
-        physical_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copyfile(os.path.join(glr_path_static(), "binder_badge_logo.svg"), str(physical_path))
-    else:
-        assert physical_path.is_file()  # noqa
+    _ensure_binder_badge(str(script.gallery.images_dir))
 
     # Create the markdown image with a link
     return f"[![Launch binder](./images/binder_badge_logo.svg)]({binder_url}){{ .center}}"
 
 
+@lru_cache(maxsize=None)
+def _ensure_binder_badge(images_dir: str):
+    """Copy the binder badge logo in `images_dir` if needed.
+
+    This is cached so that it is done once per gallery, not once per script. The cache is cleared at the end of each
+    build, in `copy_binder_files`.
+    """
+    physical_path = os.path.join(images_dir, "binder_badge_logo.svg")
+    if not os.path.isfile(physical_path):
+        # Make sure parent dirs exists (this should not be necessary actually)
+        os.makedirs(images_dir, exist_ok=True)
+        with open(physical_path, "wb") as f:
+            f.write(_get_binder_badge_bytes())
+
+
+@lru_cache(maxsize=None)
+def _get_binder_badge_bytes() -> bytes:
+    """Return the contents of the binder badge logo, read only once even if there are several galleries."""
+    with open(_BINDER_BADGE_SRC, "rb") as f:
+        return f.read()
+
+
 def copy_binder_files(gallery_conf, mkdocs_conf):
     """Copy all Binder requirements and notebooks files."""
     # if exception is not None:
@@ -133,6 +161,9 @@ def copy_binder_files(gallery_conf, mkdocs_conf):
     if not len(binder_conf) > 0:
         return
 
+    # The badge may need to be copied again in the next build (e.g. in serve mode)
+    _ensure_binder_badge.cache_clear()
+
     logger.info("copying binder requirements...")  # , color='white')
     _copy_binder_reqs(binder_conf, mkdocs_conf)
     _copy_binder_notebooks(gallery_conf, mkdocs_conf)
@@ -145,38 +176,37 @@ def _copy_binder_reqs(binder_conf, mkdocs_conf):
     """
     path_reqs = binder_conf.get("dependencies")
 
-    # Check that they exist (redundant since the check is already done by mkdocs.)
-    for path in path_reqs:
-        if not os.path.exists(path):
-            raise ConfigError(f"Couldn't find the Binder requirements file: {path}, did you specify it correctly?")
-
     # Destination folder: a ".binder" folder
     binder_folder = os.path.join(mkdocs_conf["site_dir"], ".binder")
-    if not os.path.isdir(binder_folder):
-        os.makedirs(binder_folder)
+    os.makedirs(binder_folder, exist_ok=True)
 
     # Copy over the requirement files to the output directory
     for path in path_reqs:
-        shutil.copy(path, binder_folder)
+        # Check that it exists (redundant since the check is already done by mkdocs.)
+        if not os.path.isfile(path):
+            raise ConfigError(f"Couldn't find the Binder requirements file: {path}, did you specify it correctly?")
+        shutil.copyfile(path, os.path.join(binder_folder, os.path.basename(path)))
 
 
-def _remove_ipynb_files(path, contents):
-    """Given a list of files in `contents`, remove all files named `ipynb` or
-    directories named `images` and return the result.
+def _list_ipynb_to_mirror(src_dir: str, dst_dir: str, copies: List[Tuple[str, str]]):
+    """Append to `copies` the (src, dst) paths of all `.ipynb` files found in `src_dir`, recursively, so that they can
+    be copied into `dst_dir` keeping the directory structure.
 
-    Used with the `shutil` "ignore" keyword to filter out non-ipynb files."""
-    contents_return = []
-    for entry in contents:
-        if entry.endswith(".ipynb"):
-            # Don't include ipynb files
-            pass
-        elif (entry != "images") and os.path.isdir(os.path.join(path, entry)):
-            # Don't include folders not called "images"
-            pass
-        else:
-            # Keep everything else
-            contents_return.append(entry)
-    return contents_return
+    Sub-directories named `images` are skipped. Destination directories are created as we go, only when a notebook
+    needs to be copied in them. This relies on `os.scandir` so that the type of each entry is known without an extra
+    stat call.
+    """
+    dst_created = False
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                if entry.name != "images":
+                    _list_ipynb_to_mirror(entry.path, os.path.join(dst_dir, entry.name), copies)
+            elif entry.name.endswith(".ipynb"):
+                if not dst_created:
+                    os.makedirs(dst_dir, exist_ok=True)
+                    dst_created = True
+                copies.append((entry.path, os.path.join(dst_dir, entry.name)))
 
 
 def _copy_binder_notebooks(gallery_conf, mkdocs_conf):
@@ -194,13 +224,31 @@ def _copy_binder_notebooks(gallery_conf, mkdocs_conf):
     if not isinstance(gallery_dirs, (list, tuple)):
         gallery_dirs = [gallery_dirs]
 
-    for gallery_dir in tqdm(gallery_dirs, desc=f"copying binder notebooks... "):
-        gallery_dir_rel_docs_dir = Path(gallery_dir).relative_to(mkdocs_conf["docs_dir"])
-        shutil.copytree(
-            gallery_dir,
-            os.path.join(notebooks_dir, gallery_dir_rel_docs_dir),
-            ignore=_remove_ipynb_files,
+    # First list all notebooks to copy (this creates the destination dirs)
+    copies = []
+    for gallery_dir in gallery_dirs:
+        dst_dir = os.path.join(notebooks_dir, os.path.relpath(gallery_dir, mkdocs_conf["docs_dir"]))
+        _list_ipynb_to_mirror(str(gallery_dir), dst_dir, copies)
+
+    # Then copy them concurrently: each copy is a few syscalls, releasing the GIL
+    srcs, dsts = [src for src, _ in copies], [dst for _, dst in copies]
+    with ThreadPoolExecutor(max_workers=_BINDER_COPY_MAX_WORKERS) as executor:
+        copied = executor.map(shutil.copyfile, srcs, dsts)
+        # Each copy is very fast: do not refresh the progress bar too often, and not at all for a single notebook
+        progress = tqdm(
+            copied, total=len(copies), desc="copying binder notebooks... ", mininterval=1.0, disable=len(copies) <= 1
         )
+        for _ in progress:
+            pass
+
+
+# Required and optional keys of the binder configuration. The required ones are ordered, for the error message.
+_BINDER_REQ_KEYS = ("binderhub_url", "org", "repo", "branch", "dependencies")
+_BINDER_OPT_KEYS = ("filepath_prefix", "notebooks_dir", "use_jupyter_lab")
+_BINDER_ALL_KEYS = frozenset(_BINDER_REQ_KEYS + _BINDER_OPT_KEYS)
+
+# The binder dependencies need to contain at least one of these files
+_BINDER_REQUIRED_REQS_FILES = frozenset(("requirements.txt", "environment.yml", "Dockerfile"))
 
 
 def check_binder_conf(binder_conf):
@@ -213,29 +261,24 @@ def check_binder_conf(binder_conf):
     if len(binder_conf) == 0:
         return binder_conf
 
-    # Ensure all fields are populated
-    req_values = ["binderhub_url", "org", "repo", "branch", "dependencies"]
-    optional_values = ["filepath_prefix", "notebooks_dir", "use_jupyter_lab"]
-    missing_values = []
-    for val in req_values:
-        if binder_conf.get(val) is None:
-            missing_values.append(val)
-
+    # Ensure all fields are populated, and that there are no unknown ones. Report both at once.
+    errors = []
+    missing_values = [val for val in _BINDER_REQ_KEYS if binder_conf.get(val) is None]
     if len(missing_values) > 0:
-        raise ConfigError(f"binder_conf is missing values for: {missing_values}")
+        errors.append(f"binder_conf is missing values for: {missing_values}")
 
-    for key in binder_conf.keys():
-        if key not in (req_values + optional_values):
-            raise ConfigError(f"Unknown Binder config key: {key}")
+    unknown_keys = binder_conf.keys() - _BINDER_ALL_KEYS
+    if len(unknown_keys) > 0:
+        errors.append(f"Unknown Binder config keys: {sorted(unknown_keys)}")
+
+    if len(errors) > 0:
+        raise ConfigError("; ".join(errors))
 
     # Ensure we have http in the URL
     if not any(binder_conf["binderhub_url"].startswith(ii) for ii in ["http://", "https://"]):
         raise ConfigError(f"did not supply a valid url, gave binderhub_url: {binder_conf['binderhub_url']}")
 
     # Ensure we have at least one dependency file
-    # Need at least one of these three files
-    required_reqs_files = ["requirements.txt", "environment.yml", "Dockerfile"]
-
     path_reqs = binder_conf["dependencies"]
     if isinstance(path_reqs, str):
         path_reqs = [path_reqs]
@@ -245,8 +288,7 @@ def check_binder_conf(binder_conf):
 
     binder_conf["notebooks_dir"] = binder_conf.get("notebooks_dir", "notebooks")
 
-    path_reqs_filenames = [os.path.basename(ii) for ii in path_reqs]
-    if not any(ii in path_reqs_filenames for ii in required_reqs_files):
+    if not _BINDER_REQUIRED_REQS_FILES.intersection(map(os.path.basename, path_reqs)):
         raise ConfigError(
             'Did not find one of `requirements.txt` or `environment.yml` in the "dependencies" section'
             " of the binder configuration for mkdocs-gallery. A path to at least one of these files must"
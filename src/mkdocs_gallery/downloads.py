@@ -9,13 +9,30 @@ Utilities for downloadable items
 
 from __future__ import absolute_import, division, print_function
 
+import json
+import os
+import time
+import zipfile as zipfile_module
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import List
-from zipfile import ZipFile
+from string import Template
+from typing import Dict, Iterator, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from .gen_data_model import Gallery
 from .utils import _new_file, _replace_by_new_if_needed
 
+# Max number of threads used to read the files to zip
+_ZIP_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Max number of files read ahead of their (sequential) compression, to bound the memory used while creating the zips
+_ZIP_MAX_PENDING_READS = 4 * _ZIP_MAX_WORKERS
+
+# DEFLATE level 1 gives almost the same ratio as the default level 6 on .py/.ipynb text, for a fraction of the time
+_ZIP_COMPRESSLEVEL = 1
+
 
 def python_zip(file_list: List[Path], gallery: Gallery, extension=".py"):
     """Stores all files in file_list with modified extension `extension` into an zip file
@@ -39,19 +56,193 @@ def python_zip(file_list: List[Path], gallery: Gallery, extension=".py"):
     zipfile : Path
         zip file, written as `<target_dir>_{python,jupyter}.zip` depending on the extension
     """
-    zipfile = gallery.zipfile_python if extension == ".py" else gallery.zipfile_jupyter
+    return python_zip_multi(file_list, gallery, extensions=(extension,))[0]
+
+
+def python_zip_multi(
+    file_list: List[Path], gallery: Gallery, extensions: Tuple[str, ...] = (".py", ".ipynb")
+) -> List[Path]:
+    """Same as `python_zip` for several extensions at once: creates one zip file per extension in a single pass.
+
+    Parameters
+    ----------
+    file_list : List[Path]
+        Holds all the files to be included in the zip files.
+
+    gallery : Gallery
+        gallery for which to create the zip files
+
+    extensions : Tuple[str, ...]
+        The replacement extensions for files in file_list, for each zip file. '.py' and/or '.ipynb'.
+
+    Returns
+    -------
+    zipfiles : List[Path]
+        zip files, in the same order as `extensions`. See `python_zip`.
+    """
+    zipfiles = [gallery.zipfile_python if extension == ".py" else gallery.zipfile_jupyter for extension in extensions]
+
+    # Resolve the (source file, name in archive) of all files once, for each extension
+    all_entries = [_get_zip_entries(file_list, gallery, extension) for extension in extensions]
+
+    # Shortcut: if none of the files changed since the last build, an existing zip is still valid
+    to_build = []
+    for zipfile, entries in zip(zipfiles, all_entries):
+        manifest = _get_zip_manifest(entries)
+        if not (zipfile.exists() and _read_zip_manifest(_zip_manifest_file(zipfile)) == manifest):
+            to_build.append((zipfile, entries, manifest))
+
+    if not to_build:
+        return zipfiles
+
+    # Create the new zips, iterating on the files only once.
+    # Files are read concurrently, and written sequentially in the archives. Only a bounded number of files are read
+    # ahead of the writing, so that the contents of all files are never held in memory at once.
+    zip_idx, files_src, arcnames = [], [], []
+    for file_idx in range(len(file_list)):
+        for i, (_, entries, _) in enumerate(to_build):
+            file_src, arcname = entries[file_idx]
+            zip_idx.append(i)
+            files_src.append(file_src)
+            arcnames.append(arcname)
+
+    # If there is no previous zip (first build), write directly to the final path. A manifest left over from a
+    # deleted zip is removed first, so that if the build is interrupted the partial zip is rebuilt next time.
+    zipfiles_new = []
+    for zipfile, _, _ in to_build:
+        if zipfile.exists():
+            zipfiles_new.append(_new_file(zipfile))
+        else:
+            manifest_file = _zip_manifest_file(zipfile)
+            if manifest_file.exists():
+                manifest_file.unlink()
+            zipfiles_new.append(zipfile)
+    with _zlib_backend(use_isal=gallery.conf["isal_zlib"]):
+        with ThreadPoolExecutor(max_workers=_ZIP_MAX_WORKERS) as executor, ExitStack() as stack:
+            zipfs = [
+                stack.enter_context(
+                    ZipFile(str(zipfile_new), mode="w", compression=ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL)
+                )
+                for zipfile_new in zipfiles_new
+            ]
+            zip_entries = _bounded_map(
+                executor, _read_zip_entry, files_src, arcnames, max_pending=_ZIP_MAX_PENDING_READS
+            )
+            for i, (zinfo, data) in zip(zip_idx, zip_entries):
+                zipfs[i].writestr(zinfo, data, compresslevel=_ZIP_COMPRESSLEVEL)
+
+    for (zipfile, _, manifest), zipfile_new in zip(to_build, zipfiles_new):
+        # Replace the old one if needed
+        if zipfile_new != zipfile:
+            _replace_by_new_if_needed(zipfile_new)
+
+        # Remember the contents for next build
+        _zip_manifest_file(zipfile).write_text(json.dumps(manifest, sort_keys=True))
 
-    # Create the new zip
-    zipfile_new = _new_file(zipfile)
-    with ZipFile(str(zipfile_new), mode="w") as zipf:
-        for file in file_list:
-            file_src = file.with_suffix(extension)
-            zipf.write(file_src, file_src.relative_to(gallery.generated_dir))
+    return zipfiles
 
-    # Replace the old one if needed
-    _replace_by_new_if_needed(zipfile_new)
 
-    return zipfile
+def _bounded_map(executor: Executor, fn, *iterables, max_pending: int) -> Iterator:
+    """Same as `executor.map(fn, *iterables)` but with at most `max_pending` calls submitted and not yet consumed.
+
+    Contrary to `executor.map` which submits all calls at once, this bounds the number of results held in memory.
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+@contextmanager
+def _zlib_backend(use_isal: bool):
+    """Temporarily make `zipfile` use the ISA-L accelerated `isal_zlib` (SIMD deflate and crc32) if `use_isal`.
+
+    See the 'isal_zlib' gallery configuration option. The `isal` package availability is checked at config time.
+    """
+    if not use_isal:
+        yield
+        return
+
+    from isal import isal_zlib
+
+    zlib_, crc32_ = zipfile_module.zlib, zipfile_module.crc32
+    zipfile_module.zlib, zipfile_module.crc32 = isal_zlib, isal_zlib.crc32
+    try:
+        yield
+    finally:
+        zipfile_module.zlib, zipfile_module.crc32 = zlib_, crc32_
+
+
+def _read_zip_entry(file_src: str, arcname: str) -> Tuple[ZipInfo, bytes]:
+    """Read `file_src` and create its `ZipInfo` entry named `arcname`, with a single stat and a single read.
+
+    This is equivalent to what `ZipFile.write` does, without its chunked read loop.
+    """
+    with open(file_src, "rb") as f:
+        file_stat = os.fstat(f.fileno())
+        data = f.read()
+
+    zinfo = ZipInfo(arcname, date_time=time.localtime(file_stat.st_mtime)[:6])
+    zinfo.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+    zinfo.compress_type = ZIP_DEFLATED
+    return zinfo, data
+
+
+def _zip_manifest_file(zipfile: Path) -> Path:
+    """The path of the manifest file persisted next to `zipfile`."""
+    return zipfile.with_name(zipfile.name + ".manifest.json")
+
+
+def _get_zip_entries(file_list: List[Path], gallery: Gallery, extension: str) -> List[Tuple[str, str]]:
+    """Return the list of (source file, name in the archive) for all files in `file_list`, with `extension`.
+
+    All files are .py files (see `list_downloadable_sources`), so the extension is replaced by simple slicing.
+    They are located under the gallery's `generated_dir`, so the name in the archive (the relative path) is
+    obtained by simply stripping that prefix. Note that ZipInfo takes care of converting os.sep to "/" if needed.
+    """
+    gen_root = os.fspath(gallery.generated_dir) + os.sep
+    entries = []
+    for file in file_list:
+        file_src = os.fspath(file)
+        assert file_src.startswith(gen_root) and file_src.endswith(".py")  # noqa
+        file_src = file_src[:-3] + extension
+        entries.append((file_src, file_src[len(gen_root) :]))
+    return entries
+
+
+def _get_zip_manifest(entries: List[Tuple[str, str]]) -> Dict[str, List[int]]:
+    """Return a dict {name in archive: [size, mtime_ns]} describing the zip entries (see `_get_zip_entries`).
+
+    Note: lists are used instead of tuples so that the result can be compared with the json-loaded persisted manifest.
+    """
+    manifest = dict()
+    for file_src, arcname in entries:
+        file_stat = os.stat(file_src)
+        manifest[arcname] = [file_stat.st_size, file_stat.st_mtime_ns]
+    return manifest
+
+
+def _read_zip_manifest(manifest_file: Path) -> Optional[Dict[str, List[int]]]:
+    """Return the manifest persisted in `manifest_file`, or None if it does not exist or can not be read."""
+    try:
+        return json.loads(manifest_file.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+# Rely on mkdocs-material for the icon
+_DOWNLOAD_MD_TEMPLATE = Template(
+    """
+<div id="download_links"></div>
+
+[:fontawesome-solid-download: Download all examples in Python source code: $zip_python_name](./$zip_python_rel_index_md){ .md-button .center}
+
+[:fontawesome-solid-download: Download all examples in Jupyter notebooks: $zip_jupyter_name](./$zip_jupyter_rel_index_md){ .md-button .center}
+"""  # noqa
+)
 
 
 def generate_zipfiles(gallery: Gallery):
@@ -73,15 +264,11 @@ def generate_zipfiles(gallery: Gallery):
     listdir = gallery.list_downloadable_sources(recurse=True)
 
     # Create the two zip files
-    python_zip(listdir, gallery, extension=".py")
-    python_zip(listdir, gallery, extension=".ipynb")
+    python_zip_multi(listdir, gallery, extensions=(".py", ".ipynb"))
 
-    icon = ":fontawesome-solid-download:"
-    dw_md = f"""
-<div id="download_links"></div>
-
-[{icon} Download all examples in Python source code: {gallery.zipfile_python.name}](./{gallery.zipfile_python_rel_index_md}){{ .md-button .center}}
-
-[{icon} Download all examples in Jupyter notebooks: {gallery.zipfile_jupyter.name}](./{gallery.zipfile_jupyter_rel_index_md}){{ .md-button .center}}
-"""  # noqa
-    return dw_md
+    return _DOWNLOAD_MD_TEMPLATE.substitute(
+        zip_python_name=gallery.zipfile_python.name,
+        zip_python_rel_index_md=gallery.zipfile_python_rel_index_md,
+        zip_jupyter_name=gallery.zipfile_jupyter.name,
+        zip_jupyter_rel_index_md=gallery.zipfile_jupyter_rel_index_md,
+    )
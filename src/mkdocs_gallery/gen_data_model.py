@@ -9,26 +9,29 @@ Classes holding information related to gallery examples and exposing derived inf
 
 import os
 import re
-import stat
-import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from shutil import copyfile
-from typing import Any, Dict, Iterable, List, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
 
 from .errors import ExtensionError
 from .utils import (
-    _new_file,
-    _replace_by_new_if_needed,
     _smart_copy_md5,
+    _smart_write_text,
     get_md5sum,
     is_relative_to,
-    matches_filepath_pattern,
 )
 
 
-def _has_readme(folder: Path) -> bool:
-    return _get_readme(folder, raise_error=False) is not None
+# extensions = ['.txt'] + sorted(gallery_conf['app'].config['source_suffix'])
+_README_EXTENSIONS = [".txt"] + [".md"]  # TODO should this be read from mkdocs config ? like above
+_README_FILE_NAMES = tuple(fname + ext for ext in _README_EXTENSIONS for fname in ("README", "Readme", "readme"))
+_README_FILE_NAMES_LOWER = frozenset(fname.lower() for fname in _README_FILE_NAMES)
+
+# Max number of threads used to process the script files (or the subfolders) of a gallery
+_SCRIPT_FILES_MAX_WORKERS = min(8, os.cpu_count() or 1)
 
 
 def _get_readme(dir_: Path, raise_error=True) -> Path:
@@ -36,39 +39,59 @@ def _get_readme(dir_: Path, raise_error=True) -> Path:
 
     assert dir_.is_absolute()  # noqa
 
-    # extensions = ['.txt'] + sorted(gallery_conf['app'].config['source_suffix'])
-    extensions = [".txt"] + [".md"]  # TODO should this be read from mkdocs config ? like above
-    for ext in extensions:
-        for fname in ("README", "Readme", "readme"):
-            fpth = dir_ / (fname + ext)
+    # List the files in a single pass, rather than checking each candidate name
+    with os.scandir(dir_) as it:
+        file_names = {entry.name for entry in it if entry.is_file()}
+
+    for fname in _README_FILE_NAMES:
+        if fname in file_names:
+            return dir_ / fname
+
+    # On case-insensitive file systems, a file such as 'ReadMe.md' is found when looking for 'README.md'
+    if any(name.lower() in _README_FILE_NAMES_LOWER for name in file_names):
+        for fname in _README_FILE_NAMES:
+            fpth = dir_ / fname
             if fpth.is_file():
                 return fpth
+
     if raise_error:
         raise ExtensionError(
             "Example directory {0} does not have a README/Readme/readme file "
             "with one of the expected file extensions {1}. Please write one to "
-            "introduce your gallery.".format(str(dir_), extensions)
+            "introduce your gallery.".format(str(dir_), _README_EXTENSIONS)
         )
     return None
 
 
+def _list_py_file_strs(dir_: Path) -> List[str]:
+    """Return the paths, as strings, of all .py files in `dir_` (not recursive), using a single `os.scandir` pass."""
+    with os.scandir(dir_) as it:
+        return [entry.path for entry in it if entry.name.endswith(".py") and entry.is_file()]
+
+
+def _list_py_files(dir_: Path) -> List[Path]:
+    """Return the list of all .py files in `dir_` (not recursive), using a single `os.scandir` pass."""
+    return [Path(f) for f in _list_py_file_strs(dir_)]
+
+
 class ImagePathIterator:
     """Iterate over image paths for a given example.
 
     Parameters
     ----------
-    image_path : Path
-        The template image path.
+    script : GalleryScript
+        The script for which image paths are generated.
     """
 
     def __init__(self, script: "GalleryScript"):
-        self._script = weakref.ref(script)
+        # A plain reference: the script owns this iterator, and none of these objects define `__del__`.
+        self._script = script
         self.paths = list()
         self._stop = 1000000
 
     @property
     def script(self) -> "GalleryScript":
-        return self._script()
+        return self._script
 
     def __len__(self):
         """Return the number of image paths already used."""
@@ -76,11 +99,19 @@ class ImagePathIterator:
 
     def __iter__(self):
         """Iterate over paths."""
+        paths = self.paths
+        get_image_path = self.script.get_image_path
+        stop = self._stop
+
         # we should really never have 1e6, let's prevent some user pain
-        for _ii in range(self._stop):
-            yield next(self)
-        else:
-            raise ExtensionError(f"Generated over {self._stop} images")
+        # Note: len(paths) is read at each step since `next(self)` may also be called while iterating
+        while len(paths) < stop:
+            # The +1 here is because we start image numbering at 1 in filenames
+            path = get_image_path(len(paths) + 1)
+            paths.append(path)
+            yield path
+
+        raise ExtensionError(f"Generated over {stop} images")
 
     # def next(self):
     #     return self.__next__()
@@ -194,30 +225,53 @@ class GalleryScript:
         "script_stem",
         "title",
         "_py_file_md5",
+        "_dwnld_py_file_made",
+        "_src_stat",
+        "_persisted_md5",
         "run_vars",
+        # cached paths, see the corresponding properties
+        "_src_py_file",
+        "_src_py_file_s",
+        "_dwnld_py_file",
+        "_codeobj_file",
+        "_ipynb_file",
+        "_md5_file",
+        "_md_file",
+        "_image_path_prefix",
+        "_image_name_template",
+        "_thumb_files",
+        "_src_py_file_rel_project",
+        "_dwnld_py_file_rel_site_root",
+        "_ipynb_file_rel_site_root",
+        "_md_file_rel_root_gallery",
+        "_md_file_rel_site_root",
     )
 
-    __repr__ = gen_repr(hide=("__weakref__", "_gallery"))
+    __repr__ = gen_repr(show=("script_stem", "title", "_py_file_md5", "run_vars"))
 
     def __init__(self, gallery: "GalleryBase", script_src_file: Path):
-        self._gallery = weakref.ref(gallery)
+        # Parents own their children (scripts, subsections, galleries) and children hold a plain reference back to
+        # their parent. The resulting cycles are collected by the gc since none of these classes define `__del__`.
+        self._gallery = gallery
 
-        # Make sure the script complies with the gallery
-        assert script_src_file.parent == gallery.scripts_dir  # noqa
-        assert script_src_file.suffix == ".py"  # noqa
+        # Make sure the script complies with the gallery. Note: strings are compared, this is cheaper than on `Path`s
+        script_dir, script_name = os.path.split(script_src_file)
+        assert script_dir == str(gallery.scripts_dir)  # noqa
+        assert script_name.endswith(".py")  # noqa
 
         # Only save the stem
-        self.script_stem = script_src_file.stem
+        self.script_stem = script_name[:-3]
 
         # We do not know the title yet, nor the md5 hash of the script file
         self.title: str = None
         self._py_file_md5: str = None
+        self._dwnld_py_file_made = False
         self.run_vars: ScriptRunVars = None
 
     @property
     def gallery(self) -> "GalleryBase":
         """An alias for the gallery hosting this script."""
-        return self._gallery()
+        return self._gallery
 
     @property
     def gallery_conf(self) -> Dict:
@@ -232,12 +286,29 @@ class GalleryScript:
     @property
     def src_py_file(self) -> Path:
         """The absolute script file path, e.g. <project>/examples/my_script.py"""
-        return self.gallery.scripts_dir / self.py_file_name
+        try:
+            return self._src_py_file
+        except AttributeError:
+            self._src_py_file = Path(self._src_py_file_str)
+            return self._src_py_file
+
+    @property
+    def _src_py_file_str(self) -> str:
+        """The absolute script file path as a string, for internal uses that do not need a `Path`."""
+        try:
+            return self._src_py_file_s
+        except AttributeError:
+            self._src_py_file_s = os.path.join(str(self.gallery.scripts_dir), self.py_file_name)
+            return self._src_py_file_s
 
     @property
     def src_py_file_rel_project(self) -> Path:
         """Return the relative path of script file with respect to the project root, for editing for example."""
-        return self.gallery.scripts_dir_rel_project / self.py_file_name
+        try:
+            return self._src_py_file_rel_project
+        except AttributeError:
+            self._src_py_file_rel_project = self.gallery.scripts_dir_rel_project / self.py_file_name
+            return self._src_py_file_rel_project
 
     def is_executable_example(self) -> bool:
         """Tell if this script has to be executed according to gallery configuration: filename_pattern and global plot_gallery
@@ -250,91 +321,186 @@ class GalleryScript:
         is_executable_example : bool
             True if script has to be executed
         """
-        filename_pattern = self.gallery_conf.get("filename_pattern")
-        execute = matches_filepath_pattern(self.src_py_file, filename_pattern) and self.gallery_conf["plot_gallery"]
-        return execute
+        if not self.gallery_conf["plot_gallery"]:
+            # Shortcut: all executions are disabled, no need to match the filename pattern
+            return False
+
+        filename_re = self.gallery.all_info.get_compiled_pattern("filename_pattern")
+        return filename_re.search(self._src_py_file_str) is not None
 
     @property
     def py_file_md5(self):
-        """The md5 checksum of the python script."""
+        """The md5 checksum of the python script.
+
+        If the script has the same size and modification time as when the .md5 file was persisted, the persisted md5
+        is used and the script is not read.
+        """
         if self._py_file_md5 is None:
-            self._py_file_md5 = get_md5sum(self.src_py_file, mode="t")
+            src_stat = self._src_py_file_stat
+            ref_stat, ref_md5 = self._get_persisted_md5()
+            if ref_stat is not None and ref_stat == src_stat:
+                self._py_file_md5 = ref_md5
+            else:
+                self._py_file_md5 = get_md5sum(self.src_py_file, mode="t")
         return self._py_file_md5
 
+    @property
+    def _src_py_file_stat(self) -> Tuple[int, int]:
+        """The (size, mtime_ns) of the python script, read once.
+
+        It is read before the contents of the script are read for the first time, so that a persisted stat can never
+        correspond to a more recent version of the script than the persisted md5.
+        """
+        try:
+            return self._src_stat
+        except AttributeError:
+            st = os.stat(self._src_py_file_str)
+            self._src_stat = st.st_size, st.st_mtime_ns
+            return self._src_stat
+
     @property
     def dwnld_py_file(self) -> Path:
         """The absolute path of the script in the generated gallery dir,e.g. <project>/generated/gallery/my_script.py"""
-        return self.gallery.generated_dir / self.py_file_name
+        try:
+            return self._dwnld_py_file
+        except AttributeError:
+            self._dwnld_py_file = self.gallery.generated_dir / self.py_file_name
+            return self._dwnld_py_file
 
     @property
     def dwnld_py_file_rel_site_root(self) -> Path:
         """Return the relative path of script in the generated gallery dir, wrt the mkdocs site root."""
-        return self.gallery.generated_dir_rel_site_root / self.py_file_name
+        try:
+            return self._dwnld_py_file_rel_site_root
+        except AttributeError:
+            self._dwnld_py_file_rel_site_root = self.gallery.generated_dir_rel_site_root / self.py_file_name
+            return self._dwnld_py_file_rel_site_root
 
     @property
     def codeobj_file(self):
         """The code objects file to use to store example globals"""
-        return self.gallery.generated_dir / f"{self.script_stem}_codeobj.pickle"
+        try:
+            return self._codeobj_file
+        except AttributeError:
+            self._codeobj_file = self.gallery.generated_dir / f"{self.script_stem}_codeobj.pickle"
+            return self._codeobj_file
 
     def make_dwnld_py_file(self):
-        """Copy src file to target file. Use md5 to not overwrite if not necessary."""
+        """Copy src file to target file. Use md5 to not overwrite if not necessary.
+
+        This is only done once: subsequent calls do nothing (see `GalleryBase.make_dwnld_py_files`).
+        """
+        if self._dwnld_py_file_made:
+            return
 
-        # Use the possibly already computed md5 if available
-        md5 = None
-        if self.dwnld_py_file.exists():
-            md5 = self.py_file_md5
+        # Get the source stat before it is read for the copy (see `_src_py_file_stat`)
+        self._src_py_file_stat
 
-        _smart_copy_md5(
+        # Use the possibly already known md5 if the target exists. Otherwise it is computed during the copy.
+        self._py_file_md5 = _smart_copy_md5(
             src_file=self.src_py_file,
             dst_file=self.dwnld_py_file,
-            src_md5=md5,
+            src_md5=self.py_file_md5 if self.dwnld_py_file.exists() else self._py_file_md5,
             md5_mode="t",
         )
+        self._dwnld_py_file_made = True
 
     @property
     def ipynb_file(self) -> Path:
         """Return the jupyter notebook file to generate corresponding to the source `script_file`."""
-        return self.gallery.generated_dir / f"{self.script_stem}.ipynb"
+        try:
+            return self._ipynb_file
+        except AttributeError:
+            self._ipynb_file = self.gallery.generated_dir / f"{self.script_stem}.ipynb"
+            return self._ipynb_file
 
     @property
     def ipynb_file_rel_site_root(self) -> Path:
         """Return the jupyter notebook file to generate corresponding to the source `script_file`."""
-        return self.gallery.generated_dir_rel_site_root / f"{self.script_stem}.ipynb"
+        try:
+            return self._ipynb_file_rel_site_root
+        except AttributeError:
+            self._ipynb_file_rel_site_root = self.gallery.generated_dir_rel_site_root / f"{self.script_stem}.ipynb"
+            return self._ipynb_file_rel_site_root
 
     @property
     def md5_file(self):
         """The path of the persisted md5 file written at the end of processing."""
-        file = self.dwnld_py_file
-        return file.with_name(file.name + ".md5")
+        try:
+            return self._md5_file
+        except AttributeError:
+            self._md5_file = self.gallery.generated_dir / f"{self.py_file_name}.md5"
+            return self._md5_file
 
     def write_final_md5_file(self):
-        """Writes the persisted md5 file."""
-        self.md5_file.write_text(self.py_file_md5)
+        """Writes the persisted md5 file, along with the size and modification time of the script.
+
+        The format is '<size>:<mtime_ns>:<md5>'.
+        """
+        md5 = self.py_file_md5
+        size, mtime_ns = self._src_py_file_stat
+        self.md5_file.write_text(f"{size}:{mtime_ns}:{md5}")
+        self._persisted_md5 = (size, mtime_ns), md5
+
+    def _get_persisted_md5(self) -> Tuple[Optional[Tuple[int, int]], Optional[str]]:
+        """Return the (size, mtime_ns) and md5 of the script persisted in the .md5 file. The file is read once.
+
+        The md5 is None if there is no .md5 file. The (size, mtime_ns) is None if there is no .md5 file, or if it only
+        contains the md5 (legacy format).
+        """
+        try:
+            return self._persisted_md5
+        except AttributeError:
+            ref_stat, ref_md5 = None, None
+            if self.md5_file.exists():
+                contents = self.md5_file.read_text()
+                try:
+                    size, mtime_ns, ref_md5 = contents.split(":")
+                    ref_stat = int(size), int(mtime_ns)
+                except ValueError:
+                    # Legacy format, with only the md5
+                    ref_stat, ref_md5 = None, contents
+
+            self._persisted_md5 = ref_stat, ref_md5
+            return self._persisted_md5
 
     def has_changed_wrt_persisted_md5(self) -> bool:
         """Check if the source md5 has changed with respect to the persisted .md5 file if any"""
 
-        # Compute the md5 of the src_file if needed
-        actual_md5 = self.py_file_md5
-
         # Grab the already computed md5 if it exists, and compare
-        src_md5_file = self.md5_file
-        if src_md5_file.exists():
-            ref_md5 = src_md5_file.read_text()
-            md5_has_changed = actual_md5 != ref_md5
-        else:
-            md5_has_changed = True
+        _, ref_md5 = self._get_persisted_md5()
+        if ref_md5 is None:
+            return True
+
+        # Compute the md5 of the src_file if needed (this is skipped if the size and modification time are unchanged)
+        return self.py_file_md5 != ref_md5
 
-        return md5_has_changed
+    def is_up_to_date(self) -> bool:
+        """Tell if the generated files for this script are up to date, so that it can be skipped.
+
+        This is the case if the generated markdown and notebook files exist, and if the source md5 has not changed
+        with respect to the persisted .md5 file.
+        """
+        return self.md_file.exists() and self.ipynb_file.exists() and not self.has_changed_wrt_persisted_md5()
 
     @property
     def image_name_template(self) -> str:
         """The image file name template for this script file."""
-        return "mkd_glr_%s_{0:03}.png" % self.script_stem
+        try:
+            return self._image_name_template
+        except AttributeError:
+            self._image_name_template = f"mkd_glr_{self.script_stem}_{{0:03}}.png"
+            return self._image_name_template
 
     def get_image_path(self, number: int) -> Path:
         """Return the image path corresponding to the given image number, using the template."""
-        return self.gallery.images_dir / self.image_name_template.format(number)
+        try:
+            prefix = self._image_path_prefix
+        except AttributeError:
+            # The absolute path of the images, up to the image number (same as `image_name_template`)
+            prefix = os.path.join(str(self.gallery.images_dir), f"mkd_glr_{self.script_stem}_")
+            self._image_path_prefix = prefix
+        return Path(f"{prefix}{number:03}.png")
 
     def init_before_processing(self):
         # Make the images dir
@@ -348,24 +514,47 @@ class GalleryScript:
 
     def generate_n_dummy_images(self, img: Path, nb: int):
         """Use 'stock_img' as many times as needed"""
+        # List the existing images in a single pass, and read the stock image at most once.
+        # Note: the images are not hard-linked, since they may later be overwritten in place (e.g. by `savefig`).
+        with os.scandir(self.gallery.images_dir) as it:
+            existing = {entry.path for entry in it if entry.is_file()}
+
+        img_bytes = None
         for _, path in zip(range(nb), self.run_vars.image_path_iterator):
-            if not os.path.isfile(path):
-                copyfile(str(img), path)
+            path = str(path)
+            if path not in existing:
+                if img_bytes is None:
+                    with open(img, "rb") as f:
+                        img_bytes = f.read()
+                with open(path, "wb") as f:
+                    f.write(img_bytes)
 
     @property
     def md_file(self) -> Path:
         """Return the markdown file (absolute path) to generate corresponding to the source `script_file`."""
-        return self.gallery.generated_dir / f"{self.script_stem}.md"
+        try:
+            return self._md_file
+        except AttributeError:
+            self._md_file = self.gallery.generated_dir / f"{self.script_stem}.md"
+            return self._md_file
 
     @property
     def md_file_rel_root_gallery(self) -> Path:
         """Return the markdown file relative to the root gallery folder of this gallery or subgallery"""
-        return self.gallery.subpath / f"{self.script_stem}.md"
+        try:
+            return self._md_file_rel_root_gallery
+        except AttributeError:
+            self._md_file_rel_root_gallery = self.gallery.subpath / f"{self.script_stem}.md"
+            return self._md_file_rel_root_gallery
 
     @property
     def md_file_rel_site_root(self) -> Path:
         """Return the markdown file relative to the mkdocs website source root"""
-        return self.gallery.generated_dir_rel_site_root / f"{self.script_stem}.md"
+        try:
+            return self._md_file_rel_site_root
+        except AttributeError:
+            self._md_file_rel_site_root = self.gallery.generated_dir_rel_site_root / f"{self.script_stem}.md"
+            return self._md_file_rel_site_root
 
     def save_md_example(self, example_md_contents: str):
         """
@@ -375,17 +564,8 @@ class GalleryScript:
         example_md_contents : str
             The markdown string to save
         """
-        # Write to `<py_file_name>.md.new`
-        write_file_new = _new_file(self.md_file)
-        write_file_new.write_text(example_md_contents, encoding="utf-8")
-
-        # Make it read-only so that people don't try to edit it
-        mode = os.stat(write_file_new).st_mode
-        ro_mask = 0x777 ^ (stat.S_IWRITE | stat.S_IWGRP | stat.S_IWOTH)
-        os.chmod(write_file_new, mode & ro_mask)
-
-        # In case it wasn't in our pattern, only replace the file if it's still stale.
-        _replace_by_new_if_needed(write_file_new, md5_mode="t")
+        # Only replace the file if it's still stale. Make it read-only so that people don't try to edit it
+        _smart_write_text(self.md_file, example_md_contents, read_only=True)
 
     def get_thumbnail_source(self, file_conf) -> Path:
         """Get the path to the image to use as the thumbnail.
@@ -431,8 +611,15 @@ class GalleryScript:
 
     def get_thumbnail_file(self, ext: str) -> Path:
         """Return the thumbnail file to use, for the given image file extension"""
+        try:
+            return self._thumb_files[ext]
+        except KeyError:
+            pass
+        except AttributeError:
+            self._thumb_files = dict()
         assert ext[0] == "."  # noqa
-        return self.gallery.thumb_dir / ("mkd_glr_%s_thumb%s" % (self.script_stem, ext))
+        thumb_file = self._thumb_files[ext] = self.gallery.thumb_dir / f"mkd_glr_{self.script_stem}_thumb{ext}"
+        return thumb_file
 
 
 class GalleryBase(ABC):
@@ -489,9 +676,10 @@ class GalleryBase(ABC):
         """The absolute path to the execution times markdown file associated with this gallery"""
         return self.generated_dir / "mg_execution_times.md"
 
-    def is_ignored_script_file(self, f: Path):
+    def is_ignored_script_file(self, f: Union[str, Path]):
         """Return True if file `f` is ignored according to the 'ignore_pattern' configuration."""
-        return re.search(self.conf["ignore_pattern"], os.path.normpath(str(f))) is not None
+        ignore_re = self.all_info.get_compiled_pattern("ignore_pattern")
+        return ignore_re.search(os.path.normpath(f)) is not None
 
     def collect_script_files(self, apply_ignore_pattern: bool = True, sort_files: bool = True):
         """Collects script files to process in this gallery and sort them according to configuration.
@@ -506,12 +694,13 @@ class GalleryBase(ABC):
         """
         assert not hasattr(self, "scripts"), "This can only be called once!"  # noqa
 
-        # get python files
-        listdir = list(self.scripts_dir.glob("*.py"))
+        # get python files, as strings until they are filtered
+        listdir = _list_py_file_strs(self.scripts_dir)
 
         # limit which to look at based on regex (similar to filename_pattern)
         if apply_ignore_pattern:
             listdir = [f for f in listdir if not self.is_ignored_script_file(f)]
+        listdir = [Path(f) for f in listdir]
 
         # sort them
         if sort_files:
@@ -520,9 +709,26 @@ class GalleryBase(ABC):
         # Convert to proper objects
         self.scripts: List[GalleryScript] = [GalleryScript(self, f) for f in listdir]
 
+    def make_dwnld_py_files(self):
+        """Make the downloadable copies of all scripts in this (sub)gallery, see `GalleryScript.make_dwnld_py_file`.
+
+        This is mostly I/O (stat, read, md5, write), so it is done concurrently for all scripts.
+        """
+        if len(self.scripts) <= 1:
+            for script in self.scripts:
+                script.make_dwnld_py_file()
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SCRIPT_FILES_MAX_WORKERS, len(self.scripts))) as executor:
+                for _ in executor.map(GalleryScript.make_dwnld_py_file, self.scripts):
+                    pass
+
+    def iter_all_script_files(self) -> Iterator[Path]:
+        """Iterate over all script file paths in this (sub)gallery"""
+        return (f.src_py_file for f in self.scripts)
+
     def get_all_script_files(self) -> List[Path]:
         """Return the list of all script file paths in this (sub)gallery"""
-        return [f.src_py_file for f in self.scripts]
+        return list(self.iter_all_script_files())
 
     @property
     @abstractmethod
@@ -576,14 +782,23 @@ class GalleryBase(ABC):
 class GallerySubSection(GalleryBase):
     """Represents a subsection in a gallery."""
 
-    __slots__ = ("__weakref__", "_parent", "subpath")
+    __slots__ = (
+        "__weakref__",
+        "_parent",
+        "subpath",
+        "_scripts_dir_rel_project",
+        "_scripts_dir",
+        "_generated_dir_rel_project",
+        "_generated_dir_rel_site_root",
+        "_generated_dir",
+    )
 
-    __repr__ = gen_repr(hide=("__weakref__", "_parent"))
+    __repr__ = gen_repr(show=("subpath",))
 
     def has_subsections(self) -> bool:
         return False
 
-    def __init__(self, parent: "Gallery", subpath: Path):
+    def __init__(self, parent: "Gallery", subpath: Path, readme_file: Path = None):
         """
 
         Parameters
@@ -593,14 +808,19 @@ class GallerySubSection(GalleryBase):
 
         subpath : Path
             The path to this subgallery, from its parent gallery. Must be relative.
+
+        readme_file : Path
+            The readme file of this subgallery, if it is already known. Otherwise it will be looked for when needed.
         """
         assert not subpath.is_absolute()  # noqa
         self.subpath = subpath
-        self._parent = weakref.ref(parent)
+        self._parent = parent
+        if readme_file is not None:
+            self._readme_file = readme_file
 
     @property
     def all_info(self) -> "AllInformation":
-        """Alias to access the weak reference"""
+        """Alias to access the parent object"""
         return self.root.all_info
 
     @property
@@ -610,37 +830,57 @@ class GallerySubSection(GalleryBase):
 
     @property
     def root(self) -> "Gallery":
-        """Access to the parent gallery through the weak reference."""
-        return self._parent()
+        """Access to the parent gallery."""
+        return self._parent
 
     @property
     def scripts_dir_rel_project(self):
         """The relative path (wrt project root) where this subgallery scripts are located"""
-        return self.root.scripts_dir_rel_project / self.subpath
+        try:
+            return self._scripts_dir_rel_project
+        except AttributeError:
+            self._scripts_dir_rel_project = self.root.scripts_dir_rel_project / self.subpath
+            return self._scripts_dir_rel_project
 
     @property
     def scripts_dir(self):
         """The absolute path (wrt project root) where this subgallery scripts are located"""
-        return self.root.scripts_dir / self.subpath
+        try:
+            return self._scripts_dir
+        except AttributeError:
+            self._scripts_dir = self.root.scripts_dir / self.subpath
+            return self._scripts_dir
 
     @property
     def generated_dir_rel_project(self):
         """The relative path (wrt project root) where this subgallery will be generated"""
-        return self.root.generated_dir_rel_project / self.subpath
+        try:
+            return self._generated_dir_rel_project
+        except AttributeError:
+            self._generated_dir_rel_project = self.root.generated_dir_rel_project / self.subpath
+            return self._generated_dir_rel_project
 
     @property
     def generated_dir_rel_site_root(self) -> Path:
         """The relative path (wrt mkdocs website root, e.g. docs/) where this subgallery will be generated"""
-        return self.root.generated_dir_rel_site_root / self.subpath
+        try:
+            return self._generated_dir_rel_site_root
+        except AttributeError:
+            self._generated_dir_rel_site_root = self.root.generated_dir_rel_site_root / self.subpath
+            return self._generated_dir_rel_site_root
 
     @property
     def generated_dir(self):
         """The absolute path where this subgallery will be generated"""
-        return self.root.generated_dir / self.subpath
+        try:
+            return self._generated_dir
+        except AttributeError:
+            self._generated_dir = self.root.generated_dir / self.subpath
+            return self._generated_dir
 
     def list_downloadable_sources(self) -> List[Path]:
-        """Return the list of all .py files in the subgallery generated folder"""
-        return list(self.generated_dir.glob("*.py"))
+        """Return the list of all .py files in the subgallery generated folder. They all have the '.py' suffix."""
+        return _list_py_files(self.generated_dir)
 
 
 class Gallery(GalleryBase):
@@ -655,9 +895,10 @@ class Gallery(GalleryBase):
         "generated_dir_rel_project",
         "subsections",
         "_all_info",
+        "_generated_dir_rel_site_root",
     )
 
-    __repr__ = gen_repr(hide=("__weakref__", "subsections", "_all_info"))
+    __repr__ = gen_repr(hide=("__weakref__", "subsections", "_all_info", "_generated_dir_rel_site_root"))
 
     subpath = Path(".")
 
@@ -735,32 +976,44 @@ class Gallery(GalleryBase):
 
     @property
     def generated_dir_rel_site_root(self) -> Path:
-        """The folder where the gallery files will be generated, as an absolute path."""
-        return self.generated_dir.relative_to(self.all_info.mkdocs_docs_dir)
+        """The folder where the gallery files will be generated, relative to the mkdocs website root (e.g. docs/)."""
+        try:
+            return self._generated_dir_rel_site_root
+        except AttributeError:
+            self._generated_dir_rel_site_root = self.generated_dir.relative_to(self.all_info.mkdocs_docs_dir)
+            return self._generated_dir_rel_site_root
 
     def populate_subsections(self):
         """Moved from the legacy `get_subsections`."""
 
         assert self.subsections is None, "This method can only be called once !"  # noqa
 
-        # List all subfolders with a valid readme
-        subfolders = [
-            subfolder for subfolder in self.scripts_dir.iterdir() if subfolder.is_dir() and _has_readme(subfolder)
-        ]
-
-        # Sort them
-        _sortkey = self.conf["subsection_order"]
-        sortkey = _sortkey
-        if _sortkey is not None:
+        # List all subfolders in a single pass
+        with os.scandir(self.scripts_dir) as it:
+            subfolders = [Path(entry.path) for entry in it if entry.is_dir()]
 
-            def sortkey(subfolder: Path):
-                # Apply on the string representation of the folder
-                return sortkey(str(subfolder))
-
-        sorted_subfolders = sorted(subfolders, key=sortkey)
+        # Look for their readme, concurrently since this is a directory listing per subfolder. Remember the valid ones
+        if len(subfolders) <= 1:
+            readmes = [_get_readme(subfolder, raise_error=False) for subfolder in subfolders]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SCRIPT_FILES_MAX_WORKERS, len(subfolders))) as executor:
+                readmes = list(executor.map(partial(_get_readme, raise_error=False), subfolders))
+        readme_files = {f: readme for f, readme in zip(subfolders, readmes) if readme is not None}
+        subfolders = list(readme_files)
+
+        # Sort them. The sort key (e.g. `ExplicitOrder`) is applied on each folder path, once per folder.
+        sortkey = self.conf["subsection_order"]
+        if sortkey is not None:
+            keys = {subfolder: sortkey(subfolder) for subfolder in subfolders}
+            sorted_subfolders = sorted(subfolders, key=keys.__getitem__)
+        else:
+            sorted_subfolders = sorted(subfolders)
 
         self.subsections = tuple(
-            (GallerySubSection(self, subpath=f.relative_to(self.scripts_dir)) for f in sorted_subfolders)
+            (
+                GallerySubSection(self, subpath=f.relative_to(self.scripts_dir), readme_file=readme_files[f])
+                for f in sorted_subfolders
+            )
         )
 
     def collect_script_files(
@@ -790,21 +1043,25 @@ class Gallery(GalleryBase):
         # Then the gallery itself
         GalleryBase.collect_script_files(self, apply_ignore_pattern=apply_ignore_pattern, sort_files=sort_files)
 
-    def get_all_script_files(self, recurse=True):
-        res = GalleryBase.get_all_script_files(self)
-        if recurse:
-            for g in self.subsections:
-                res += g.get_all_script_files()
-        return res
+    def iter_all_script_files(self, recurse=True) -> Iterator[Path]:
+        """Iterate over all script file paths in this gallery, and in its subsections if `recurse` is True"""
+        own_files = GalleryBase.iter_all_script_files(self)
+        if not recurse:
+            return own_files
+        return chain(own_files, chain.from_iterable(g.iter_all_script_files() for g in self.subsections))
+
+    def get_all_script_files(self, recurse=True) -> List[Path]:
+        """Return the list of all script file paths in this gallery, and in its subsections if `recurse` is True"""
+        return list(self.iter_all_script_files(recurse=recurse))
 
     def _attach(self, all_info: "AllInformation"):
-        """Attach a weak reference to the parent object."""
-        self._all_info: "AllInformation" = weakref.ref(all_info)  # type: ignore
+        """Attach a reference to the parent object."""
+        self._all_info: "AllInformation" = all_info
 
     @property
     def all_info(self) -> "AllInformation":
-        """Alias to access the weak reference"""
-        return self._all_info()
+        """Alias to access the parent object"""
+        return self._all_info
 
     @property
     def conf(self):
@@ -812,11 +1069,10 @@ class Gallery(GalleryBase):
         return self.all_info.gallery_conf
 
     def list_downloadable_sources(self, recurse=True) -> List[Path]:
-        """Return the list of all .py files in the gallery generated folder"""
-        results = list(self.generated_dir.glob("*.py"))
+        """Return the list of all .py files in the gallery generated folder. They all have the '.py' suffix."""
+        results = _list_py_files(self.generated_dir)
         if recurse:
-            for g in self.subsections:
-                results += g.list_downloadable_sources()
+            results.extend(chain.from_iterable(g.list_downloadable_sources() for g in self.subsections))
 
         return results
 
@@ -846,6 +1102,10 @@ class AllInformation:
         "gallery_conf",
         "mkdocs_conf",
         "project_root_dir",
+        "_compiled_patterns",
+        "_mkdocs_docs_dir",
+        "_mkdocs_site_dir",
+        "_backrefs_dir",
     )
 
     __repr__ = gen_repr(show="project_root_dir")
@@ -864,11 +1124,8 @@ class AllInformation:
         gallery_conf : Dict[str, Any]
             The global mkdocs-gallery config.
 
-        mkdocs_docs_dir : Path
-            The 'docs_dir' option in mkdocs.
-
-        mkdocs_site_dir : Path
-            The 'site_dir' option in mkdocs
+        mkdocs_conf : Dict[str, Any]
+            The mkdocs config. Its 'docs_dir' and 'site_dir' options are read once here.
 
         project_root_dir
         gallery_elts
@@ -879,16 +1136,45 @@ class AllInformation:
         self.project_root_dir = project_root_dir
 
         self.mkdocs_conf = mkdocs_conf
+        self._mkdocs_docs_dir = Path(mkdocs_conf["docs_dir"])
+        self._mkdocs_site_dir = Path(mkdocs_conf["site_dir"])
 
         self.galleries = list(gallery_elts)
 
+        # The compiled regex patterns from the configuration, see `get_compiled_pattern`
+        self._compiled_patterns: Dict[str, Tuple[str, Pattern]] = dict()
+
+    def get_compiled_pattern(self, conf_key: str) -> Pattern:
+        """Return the compiled regex for the pattern option `conf_key` of the gallery configuration.
+
+        It is compiled once and reused for all scripts, as long as the option is not modified.
+
+        Parameters
+        ----------
+        conf_key : str
+            The name of the pattern option, e.g. 'filename_pattern' or 'ignore_pattern'.
+        """
+        pattern = self.gallery_conf[conf_key]
+        try:
+            cached_pattern, compiled = self._compiled_patterns[conf_key]
+        except KeyError:
+            cached_pattern = None
+
+        if cached_pattern != pattern:
+            compiled = re.compile(pattern)
+            self._compiled_patterns[conf_key] = pattern, compiled
+
+        return compiled
+
     @property
     def mkdocs_docs_dir(self) -> Path:
-        return Path(self.mkdocs_conf["docs_dir"])
+        """The 'docs_dir' option in mkdocs."""
+        return self._mkdocs_docs_dir
 
     @property
     def mkdocs_site_dir(self) -> Path:
-        return Path(self.mkdocs_conf["site_dir"])
+        """The 'site_dir' option in mkdocs."""
+        return self._mkdocs_site_dir
 
     def add_gallery(self, scripts_dir: Union[str, Path], generated_dir: Union[str, Path]):
         """Add a gallery to the list of known galleries.
@@ -927,20 +1213,59 @@ class AllInformation:
         sort_files: bool = True,
     ):
         """Triggers the files collection in all galleries."""
+        # Each (sub)gallery only lists and sorts its own scripts, independently: do it concurrently since this is
+        # mostly directory listings and file reads.
+        to_collect = []
         for g in self.galleries:
-            g.collect_script_files(
-                recurse=do_subgalleries,
-                apply_ignore_pattern=apply_ignore_pattern,
-                sort_files=sort_files,
-            )
+            if do_subgalleries:
+                to_collect.extend(g.subsections)
+            to_collect.append(g)
+
+        collect = partial(
+            GalleryBase.collect_script_files,
+            apply_ignore_pattern=apply_ignore_pattern,
+            sort_files=sort_files,
+        )
+        if len(to_collect) <= 1:
+            for g in to_collect:
+                collect(g)
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SCRIPT_FILES_MAX_WORKERS, len(to_collect))) as executor:
+                for _ in executor.map(collect, to_collect):
+                    pass
+
+    def prefetch_script_stats(self):
+        """Read the (size, mtime_ns) of all collected scripts concurrently, see `GalleryScript._src_py_file_stat`.
 
-    def get_all_script_files(self):
-        return [f for g in self.galleries for f in g.get_all_script_files()]
+        This overlaps the latency of all these `os.stat` calls, across all galleries and subsections. It should be
+        called before the scripts are copied or hashed.
+        """
+        scripts = [s for g in self.galleries for sg in chain(g.subsections, (g,)) for s in sg.scripts]
+        if len(scripts) <= 1:
+            for script in scripts:
+                script._src_py_file_stat
+        else:
+            get_stat = GalleryScript._src_py_file_stat.fget
+            with ThreadPoolExecutor(max_workers=min(_SCRIPT_FILES_MAX_WORKERS, len(scripts))) as executor:
+                for _ in executor.map(get_stat, scripts):
+                    pass
+
+    def iter_all_script_files(self) -> Iterator[Path]:
+        """Iterate over all script file paths in all galleries, lazily."""
+        return chain.from_iterable(g.iter_all_script_files() for g in self.galleries)
+
+    def get_all_script_files(self) -> List[Path]:
+        """Return the list of all script file paths in all galleries. Use `iter_all_script_files` to iterate once."""
+        return list(self.iter_all_script_files())
 
     @property
     def backrefs_dir(self) -> Path:
         """The absolute path to the backreferences dir"""
-        return Path(self.gallery_conf["backreferences_dir"])
+        try:
+            return self._backrefs_dir
+        except AttributeError:
+            self._backrefs_dir = Path(self.gallery_conf["backreferences_dir"])
+            return self._backrefs_dir
 
     def get_backreferences_file(self, module_name) -> Path:
         """Return the path to the backreferences file to use for `module_name`"""
@@ -954,11 +1279,11 @@ class AllInformation:
         This class method replaces `_prepare_gallery_dirs`.
         """
 
-        # The project root directory
-        project_root_dir = Path(os.path.abspath(mkdocs_conf["config_file_path"])).parent
-        project_root2 = Path(os.getcwd())
-        if project_root2 != project_root_dir:
+        # The project root directory. Note: compared as (case-normalized) strings, cheaper than `Path`s
+        project_root = os.path.dirname(os.path.abspath(mkdocs_conf["config_file_path"]))
+        if os.path.normcase(project_root) != os.path.normcase(os.getcwd()):
             raise ValueError("The project root dir is ambiguous ! Please report this issue to mkdocs-gallery.")
+        project_root_dir = Path(project_root)
 
         # Create the global object
         all_info = AllInformation(
@@ -967,20 +1292,15 @@ class AllInformation:
             project_root_dir=project_root_dir,
         )
 
-        # Source and destination of the galleries
+        # Source and destination of the galleries. Note: they were normalized as tuples when parsing the config
         examples_dirs = gallery_conf["examples_dirs"]
         gallery_dirs = gallery_conf["gallery_dirs"]
 
-        if not isinstance(examples_dirs, list):
-            examples_dirs = [examples_dirs]
-
-        if not isinstance(gallery_dirs, list):
-            gallery_dirs = [gallery_dirs]
-
         # Back references page
         backreferences_dir = gallery_conf["backreferences_dir"]
-        if backreferences_dir:
-            Path(backreferences_dir).mkdir(parents=True, exist_ok=True)
+        if backreferences_dir and not os.path.isdir(backreferences_dir):
+            # Note: a single stat in the usual case where it already exists (e.g. rebuilds in 'mkdocs serve')
+            all_info.backrefs_dir.mkdir(parents=True, exist_ok=True)
 
         # Create galleries
         for e_dir, g_dir in zip(examples_dirs, gallery_dirs):
@@ -23,7 +23,7 @@ from typing import Dict, Iterable, List, Set, Tuple
 from xml.sax.saxutils import escape, quoteattr  # noqa  # indeed this is just quoting and escaping
 
 from . import mkdocs_compatibility
-from .backreferences import _finalize_backreferences
+from .backreferences import _finalize_backreferences, _from_import_cached, _get_short_module_name
 from .binder import check_binder_conf
 from .downloads import generate_zipfiles
 from .errors import ConfigError, ExtensionError
@@ -98,6 +98,7 @@ DEFAULT_GALLERY_CONF = {
     "image_srcset": [],
     "default_thumb_file": None,
     "line_numbers": False,
+    "isal_zlib": False,
 }
 
 logger = mkdocs_compatibility.getLogger("mkdocs-gallery")
@@ -112,6 +113,15 @@ def _bool_eval(x):
     return bool(x)
 
 
+def _as_tuple(x) -> Tuple:
+    """Return `x` as a tuple: unchanged if it is already one, converted if it is a list, else wrapped."""
+    if isinstance(x, tuple):
+        return x
+    if isinstance(x, list):
+        return tuple(x)
+    return (x,)
+
+
 def parse_config(mkdocs_gallery_conf, mkdocs_conf, check_keys=True):
     """Process the Sphinx Gallery configuration."""
 
@@ -188,6 +198,10 @@ def _complete_gallery_conf(
         )
         gallery_conf["image_scrapers"] += ("mayavi",)
 
+    # A single examples or gallery dir can be provided: normalize them once here, as tuples
+    gallery_conf["examples_dirs"] = _as_tuple(gallery_conf["examples_dirs"])
+    gallery_conf["gallery_dirs"] = _as_tuple(gallery_conf["gallery_dirs"])
+
     # Text to Class for sorting methods
     _order = gallery_conf["subsection_order"]
     if isinstance(_order, str):
@@ -255,6 +269,14 @@ def _complete_gallery_conf(
         gallery_conf["call_memory"] = call_memory
     assert callable(gallery_conf["call_memory"])  # noqa
 
+    # deal with isal_zlib
+    if gallery_conf["isal_zlib"]:
+        try:
+            from isal import isal_zlib  # noqa
+        except ImportError:
+            logger.warning("Please install 'isal' to enable accelerated zip compression with 'isal_zlib'.")
+            gallery_conf["isal_zlib"] = False
+
     # deal with scrapers
     scrapers = gallery_conf["image_scrapers"]
     if not isinstance(scrapers, (tuple, list)):
@@ -419,7 +441,11 @@ def generate_gallery_md(gallery_conf, mkdocs_conf) -> Dict[Path, Tuple[str, Dict
     logger.info("generating gallery...")  # , color='white')
     # gallery_conf = parse_config(app)  already done
 
-    seen_backrefs = set()
+    # The modules may have changed since the previous build (e.g. in serve mode), so the import results are not reused
+    _from_import_cached.cache_clear()
+    _get_short_module_name.cache_clear()
+
+    seen_backrefs = dict()
     md_files_toc = dict()
     md_to_src_file = dict()
 
@@ -428,6 +454,7 @@ def generate_gallery_md(gallery_conf, mkdocs_conf) -> Dict[Path, Tuple[str, Dict
 
     # Gather all files except ignored ones, and sort them according to the configuration.
     all_info.collect_script_files()
+    all_info.prefetch_script_stats()
 
     # Check for duplicate filenames to make sure linking works as expected
     files = all_info.get_all_script_files()
@@ -29,7 +29,7 @@ from pathlib import Path
 from shutil import copyfile
 from textwrap import indent, dedent
 from time import time
-from typing import List, Set, Tuple
+from typing import Dict, List, Tuple
 
 from tqdm import tqdm
 
@@ -406,7 +406,7 @@ def create_thumb_from_image(script: GalleryScript, src_image_path: Path) -> Path
     return thumb_file
 
 
-def generate(gallery: GalleryBase, seen_backrefs: Set) -> Tuple[str, str, str, List[GalleryScriptResults]]:
+def generate(gallery: GalleryBase, seen_backrefs: Dict) -> Tuple[str, str, str, List[GalleryScriptResults]]:
     """
     Generate the gallery md for an example directory, including the index.
 
@@ -415,8 +415,8 @@ def generate(gallery: GalleryBase, seen_backrefs: Set) -> Tuple[str, str, str, L
     gallery : GalleryBase
         The gallery or subgallery to process
 
-    seen_backrefs : Set
-        Backrefs seen so far.
+    seen_backrefs : Dict
+        Backrefs seen so far, with their accumulated markdown contents.
 
     Returns
     -------
@@ -442,8 +442,9 @@ def generate(gallery: GalleryBase, seen_backrefs: Set) -> Tuple[str, str, str, L
         # Dont look for the last subtitle
         last_readme_subtitle = None
 
-    # Create the destination dir if needed
+    # Create the destination dir if needed, and copy all scripts there at once
     gallery.make_generated_dir()
+    gallery.make_dwnld_py_files()
 
     all_thumbnail_entries = []
     results = []
@@ -1015,15 +1016,15 @@ def generate_file_md(script: GalleryScript, seen_backrefs=None) -> GalleryScript
     script : GalleryScript
         The script to process
 
-    seen_backrefs : set
-        The seen backreferences.
+    seen_backrefs : dict
+        The seen backreferences, with their accumulated markdown contents.
 
     Returns
     -------
     result: FileResult
         The result of running this script
     """
-    seen_backrefs = set() if seen_backrefs is None else seen_backrefs
+    seen_backrefs = dict() if seen_backrefs is None else seen_backrefs
 
     # Extract the contents of the script
     file_conf, script_blocks, node = split_code_and_text_blocks(script.src_py_file, return_node=True)
@@ -1036,7 +1037,7 @@ def generate_file_md(script: GalleryScript, seen_backrefs=None) -> GalleryScript
     script.make_dwnld_py_file()
 
     # Can the script be entirely skipped (both doc generation and execution) ?
-    if not script.has_changed_wrt_persisted_md5():
+    if script.is_up_to_date():
         # A priori we can...
         skip_and_return = True
 
@@ -20,12 +20,17 @@ def red(msg):
 def getLogger(name="mkdocs-gallery"):
     """From https://github.com/fralau/mkdocs-mermaid2-plugin/pull/19/."""
     log = logging.getLogger("mkdocs.plugins." + name)
-    log.addFilter(warning_filter)
 
-    # todo what about colors ? currently we remove the argument in each call
+    # Loggers are singletons: only set them up the first time
+    if not getattr(log, "_mkg_filter_installed", False):
+        log.addFilter(warning_filter)
 
-    # the verbose method does not exist
-    log.verbose = log.debug
+        # todo what about colors ? currently we remove the argument in each call
+
+        # the verbose method does not exist
+        log.verbose = log.debug
+
+        log._mkg_filter_installed = True
 
     return log
 
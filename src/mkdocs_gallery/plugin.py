@@ -9,9 +9,12 @@ The mkdocs plugin entry point
 import os
 import platform
 import re
+from copy import deepcopy
+from functools import lru_cache
+from importlib import import_module
 from os.path import relpath
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from mkdocs import __version__ as mkdocs_version_str
 from mkdocs.config import config_options as co
@@ -24,17 +27,19 @@ from packaging import version
 from packaging.version import parse as parse_version
 
 from . import glr_path_static
-from .binder import copy_binder_files
 
+# Note: `.binder` and `.gen_gallery` are imported lazily in the hooks below, so that importing the plugin is fast
 # from .docs_resolv import embed_code_links
-from .gen_gallery import fill_mkdocs_nav, generate_gallery_md, parse_config, summarize_failing_examples
-from .utils import is_relative_to
 
 IS_PY37 = parse_version("3.7") <= parse_version(platform.python_version()) < parse_version("3.8")
 
 mkdocs_version = version.parse(mkdocs_version_str)
 is_mkdocs_14_or_greater = mkdocs_version >= version.parse("1.4")
 
+# The static resources are shipped with the package: list the css files only once
+_STATIC_RESOURCES_DIR = glr_path_static()
+_STATIC_CSS_FILES = tuple(f for f in os.listdir(_STATIC_RESOURCES_DIR) if f.endswith(".css"))
+
 
 class ConfigList(co.OptionallyRequired):
     """A list or single element of configuration matching a specific ConfigOption"""
@@ -48,22 +53,49 @@ class ConfigList(co.OptionallyRequired):
         super().__init__(**kwargs)
         self.single_elt_allowed = single_elt_allowed
         self.item_config = item_config
+        self._validate_item = self._get_item_validator(item_config)
+
+    @staticmethod
+    def _get_item_validator(item_config: co.BaseConfigOption):
+        """Return the function used to validate each item. Plain `co.Type` items are checked inline."""
+        validate = item_config.validate
+        if type(item_config) is co.Type and item_config.length is None:
+            item_type = item_config._type
+
+            def validate_type(value):
+                # Fast path for valid items, otherwise let mkdocs handle it (None/default and error message)
+                return value if isinstance(value, item_type) else validate(value)
+
+            return validate_type
+
+        return validate
 
     def run_validation(self, value):
+        validate = self._validate_item
+
         if not isinstance(value, (list, tuple)):
             if self.single_elt_allowed:
-                value = (value,)
+                # Validate the single element directly
+                try:
+                    return [validate(value)]
+                except ValidationError as e:
+                    raise ValidationError(f"Error validating config item #1: {e}")
             else:
                 msg = f"Expected a list but received a single element: {value}."
                 raise ValidationError(msg)
 
-        # Validate all elements in the list
+        # Validate all elements in the list, and report all errors at once
         result = []
+        errors = []
         for i, v in enumerate(value):
             try:
-                result.append(self.item_config.validate(v))
+                result.append(validate(v))
             except ValidationError as e:
-                raise ValidationError(f"Error validating config item #{i+1}: {e}")
+                errors.append(f"Error validating config item #{i+1}: {e}")
+
+        if errors:
+            raise ValidationError("; ".join(errors))
+
         return result
 
 
@@ -195,6 +227,7 @@ class GalleryPlugin(BasePlugin):
         ("image_srcset", ConfigList(co.Type(str))),
         ("default_thumb_file", File(exists=True)),
         ("line_numbers", co.Type(bool)),
+        ("isal_zlib", co.Type(bool)),
     )
 
     def on_config(self, config, **kwargs):
@@ -202,49 +235,19 @@ class GalleryPlugin(BasePlugin):
         TODO Add plugin templates and scripts to config.
         """
 
-        from mkdocs.utils import yaml_load
-
         # Enable navigation indexes in "material" theme,
         # see https://squidfunk.github.io/mkdocs-material/setup/setting-up-navigation/#section-index-pages
         if config["theme"].name == "material":
-            if "navigation.indexes" not in config["theme"]["features"]:
-                if "toc.integrate" not in config["theme"]["features"]:
-                    config["theme"]["features"].append("navigation.indexes")
-
-        # Set Python version dependent emoji logic for backward compatibility
-        mx_name = "materialx" if IS_PY37 else "material.extensions"
-
-        extra_config_yml = f"""
-markdown_extensions:
-  # to declare attributes such as css classes on markdown elements. For example to change the color
-  - attr_list
-
-  # to add notes such as http://squidfunk.github.io/mkdocs-material/extensions/admonition/
-  - admonition
+            features = config["theme"]["features"]
+            if not {"navigation.indexes", "toc.integrate"}.intersection(features):
+                features.append("navigation.indexes")
 
-  # to display the code blocks https://squidfunk.github.io/mkdocs-material/reference/code-blocks/
-  - pymdownx.highlight
-  - pymdownx.inlinehilite
-  - pymdownx.details
-  - pymdownx.superfences
-  - pymdownx.snippets
-
-  # to have the download icons in the buttons
-  - pymdownx.emoji:
-      emoji_index: !!python/name:{mx_name}.emoji.twemoji
-      emoji_generator: !!python/name:{mx_name}.emoji.to_svg
-
-
-"""
-        extra_config = yaml_load(extra_config_yml)
-        merge_extra_config(extra_config, config)
+        # Add the markdown extensions needed by the generated pages. Note: a copy is made since we modify it
+        merge_extra_config(deepcopy(_load_extra_config()), config)
 
         # Append static resources
-        static_resources_dir = glr_path_static()
-        config["theme"].dirs.append(static_resources_dir)
-        for css_file in os.listdir(static_resources_dir):
-            if css_file.endswith(".css"):
-                config["extra_css"].append(css_file)
+        config["theme"].dirs.append(_STATIC_RESOURCES_DIR)
+        config["extra_css"].extend(_STATIC_CSS_FILES)
         # config['theme'].static_templates.add('search.html')
         # config['extra_javascript'].append('search/main.js')
 
@@ -256,6 +259,8 @@ markdown_extensions:
         self.conf_script = self.config["conf_script"]
 
         # Use almost the original sphinx-gallery config validator
+        from .gen_gallery import parse_config
+
         self.config = parse_config(self.config, mkdocs_conf=config)
 
         # TODO do we need to register those CSS files and how ? (they are already registered ads
@@ -278,6 +283,8 @@ markdown_extensions:
         #   app.add_directive("image-sg", ImageSg)
         #   imagesg_addnode(app)
 
+        from .gen_gallery import fill_mkdocs_nav, generate_gallery_md
+
         galleries_tocs, self.md_to_src = generate_gallery_md(self.config, config)
 
         # Update the nav for all galleries if needed
@@ -292,17 +299,17 @@ markdown_extensions:
     def on_files(self, files, config):
         """Remove the gallery examples *source* md files (in "examples_dirs") from the built website"""
 
-        # Get the list of gallery source files, possibly containing the readme.md that we wish to exclude
-        examples_dirs = self._get_dirs_relative_to(self.config["examples_dirs"], rel_to_dir=config["docs_dir"])
+        # Get the gallery source dirs, possibly containing the readme.md that we wish to exclude
+        examples_dirs_prefixes = self._get_examples_dirs_prefixes(rel_to_dir=config["docs_dir"])
 
         # Add the binder config files if needed
         binder_cfg = self.config["binder"]
         if binder_cfg:
-            binder_files = [
+            binder_files = {
                 Path(path).relative_to(config["docs_dir"]).as_posix() for path in binder_cfg["dependencies"]
-            ]
+            }
         else:
-            binder_files = []
+            binder_files = set()
 
         # Add the gallery config script if needed
         if self.conf_script:
@@ -317,7 +324,7 @@ markdown_extensions:
 
         def exclude(i):
             # Get a posix version of the relative path so as to be sure to match ok
-            posix_src_path = Path(i.src_path).as_posix()
+            posix_src_path = i.src_path.replace(os.sep, "/")
 
             # Is it the conf script or a derived work of the conf script ?
             if self.conf_script:
@@ -325,9 +332,8 @@ markdown_extensions:
                     return True
 
             # Is it located in a gallery source directory ?
-            for d in examples_dirs:
-                if posix_src_path.startswith(d):
-                    return True
+            if posix_src_path.startswith(examples_dirs_prefixes):
+                return True
 
             # Is it a binder dependency file ?
             if posix_src_path in binder_files:
@@ -335,18 +341,36 @@ markdown_extensions:
 
             return False
 
-        out = []
-        for i in files:
-            if not exclude(i):
-                out.append(i)
+        return Files([i for i in files if not exclude(i)])
+
+    def _get_examples_dirs_prefixes(self, rel_to_dir: str) -> Tuple[str, ...]:
+        """Return the "examples_dirs" relative to `rel_to_dir`, as posix strings ending with a "/".
+
+        This is suitable for a direct `str.startswith` check on posix paths. The result is cached on the plugin so
+        that it is only computed again when the dirs change.
+        """
+        examples_dirs = self.config["examples_dirs"]
+        key = (tuple(examples_dirs) if isinstance(examples_dirs, (list, tuple)) else examples_dirs, rel_to_dir)
+        try:
+            cached_key, prefixes = self._examples_dirs_prefixes
+        except AttributeError:
+            cached_key = None
+
+        if cached_key != key:
+            prefixes = tuple(
+                d.rstrip("/") + "/" for d in self._get_dirs_relative_to(examples_dirs, rel_to_dir=rel_to_dir)
+            )
+            self._examples_dirs_prefixes = key, prefixes
 
-        return Files(out)
+        return prefixes
 
-    def _get_dirs_relative_to(self, dir_or_list_of_dirs: Union[str, List[str]], rel_to_dir: str) -> List[str]:
+    def _get_dirs_relative_to(
+        self, dir_or_list_of_dirs: Union[str, List[str], Tuple[str, ...]], rel_to_dir: str
+    ) -> List[str]:
         """Return dirs relative to another dir. If dirs is a single element, converts to a list first"""
 
-        # Make sure the list is a list (handle single elements)
-        if not isinstance(dir_or_list_of_dirs, list):
+        # Make sure the list is a list or tuple (handle single elements)
+        if not isinstance(dir_or_list_of_dirs, (list, tuple)):
             dir_or_list_of_dirs = [dir_or_list_of_dirs]
 
         # Get them relative to the mkdocs source dir
@@ -389,58 +413,107 @@ markdown_extensions:
         excluded_dirs = self.config["gallery_dirs"]
         if isinstance(excluded_dirs, str):
             excluded_dirs = [excluded_dirs]  # a single dir
+        else:
+            excluded_dirs = list(excluded_dirs)
         backrefs_dir = self.config["backreferences_dir"]
         if backrefs_dir:
             excluded_dirs.append(backrefs_dir)
 
+        # Normalize once so that each event is handled with a single (C-level) prefix check
+        excluded_dirs = tuple(os.path.normpath(g) for g in excluded_dirs)
+        excluded_prefixes = tuple(g + os.sep for g in excluded_dirs)
+
         def wrap_callback(original_callback):
             def _callback(event):
-                for g in excluded_dirs:
-                    if is_relative_to(g, Path(event.src_path)):
-                        # ignore this event: the file is in the gallery target dir.
-                        # log.info(f"Ignoring event: {event}")
-                        return
+                src_path = event.src_path
+                if src_path.startswith(excluded_prefixes) or src_path in excluded_dirs:
+                    # ignore this event: the file is in the gallery target dir.
+                    # log.info(f"Ignoring event: {event}")
+                    return
                 return original_callback(event)
 
+            # Remember the original so that wrapping again (on a later `on_serve`) does not chain the wrappers
+            _callback._mkdocs_gallery_original = original_callback
             return _callback
 
         # TODO this is an ugly hack...
         # Find the objects in charge of monitoring the dirs and modify their callbacks
         for _watch, handlers in server.observer._handlers.items():
             for h in handlers:
-                h.on_any_event = wrap_callback(h.on_any_event)
+                h.on_any_event = wrap_callback(getattr(h.on_any_event, "_mkdocs_gallery_original", h.on_any_event))
 
         return server
 
     def on_post_build(self, config, **kwargs):
         """Create one md file for each python example in the gallery."""
 
+        from .binder import copy_binder_files
+        from .gen_gallery import summarize_failing_examples
+
         copy_binder_files(gallery_conf=self.config, mkdocs_conf=config)
         summarize_failing_examples(gallery_conf=self.config, mkdocs_conf=config)
         # TODO embed_code_links()
 
 
+@lru_cache(maxsize=None)
+def _load_extra_config() -> Dict[str, Any]:
+    """Return the extra mkdocs configuration needed by mkdocs-gallery. Built once, on first use."""
+
+    # Set Python version dependent emoji logic for backward compatibility
+    emoji = import_module("materialx.emoji" if IS_PY37 else "material.extensions.emoji")
+
+    return {
+        "markdown_extensions": [
+            # to declare attributes such as css classes on markdown elements. For example to change the color
+            "attr_list",
+            # to add notes such as http://squidfunk.github.io/mkdocs-material/extensions/admonition/
+            "admonition",
+            # to display the code blocks https://squidfunk.github.io/mkdocs-material/reference/code-blocks/
+            "pymdownx.highlight",
+            "pymdownx.inlinehilite",
+            "pymdownx.details",
+            "pymdownx.superfences",
+            "pymdownx.snippets",
+            # to have the download icons in the buttons
+            {
+                "pymdownx.emoji": {
+                    "emoji_index": emoji.twemoji,
+                    "emoji_generator": emoji.to_svg,
+                }
+            },
+        ]
+    }
+
+
 def merge_extra_config(extra_config: Dict[str, Any], config):
     """Extend the configuration 'markdown_extensions' list with extension_name if needed."""
 
+    markdown_extensions = config["markdown_extensions"]
+    mdx_configs = config["mdx_configs"]
+
+    # Names of the extensions already present, for fast membership checks
+    present = {e if isinstance(e, str) else next(iter(e)) for e in markdown_extensions}
+
     for extension_cfg in extra_config["markdown_extensions"]:
         if isinstance(extension_cfg, str):
             extension_name = extension_cfg
-            if extension_name not in config["markdown_extensions"]:
-                config["markdown_extensions"].append(extension_name)
+            if extension_name not in present:
+                markdown_extensions.append(extension_name)
+                present.add(extension_name)
         elif isinstance(extension_cfg, dict):
             assert len(extension_cfg) == 1  # noqa
             extension_name, extension_options = extension_cfg.popitem()
-            if extension_name not in config["markdown_extensions"]:
-                config["markdown_extensions"].append(extension_name)
-            if extension_name not in config["mdx_configs"]:
-                config["mdx_configs"][extension_name] = extension_options
+            if extension_name not in present:
+                markdown_extensions.append(extension_name)
+                present.add(extension_name)
+            if extension_name not in mdx_configs:
+                mdx_configs[extension_name] = extension_options
             else:
                 # Only add options that are not already set
                 # TODO should we warn ?
+                ext_mdx_configs = mdx_configs[extension_name]
                 for cfg_key, cfg_val in extension_options.items():
-                    if cfg_key not in config["mdx_configs"][extension_name]:
-                        config["mdx_configs"][extension_name][cfg_key] = cfg_val
+                    ext_mdx_configs.setdefault(cfg_key, cfg_val)
         else:
             raise TypeError(extension_cfg)
 
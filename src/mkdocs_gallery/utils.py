@@ -16,10 +16,10 @@ import asyncio
 import hashlib
 import os
 import re
+import stat
 import subprocess
 from pathlib import Path
 from shutil import copyfile, move
-from typing import Tuple
 
 from . import mkdocs_compatibility
 from .errors import ExtensionError
@@ -159,12 +159,24 @@ def get_md5sum(src_file: Path, mode="b"):
         File mode to open file with. When in text mode, universal line endings
         are used to ensure consitency in hashes between platforms.
     """
-    errors = "surrogateescape" if mode == "t" else None
-    with open(str(src_file), "r" + mode, errors=errors) as src_data:
-        src_content = src_data.read()
-        if mode == "t":
-            src_content = src_content.encode(errors=errors)
-        return hashlib.md5(src_content).hexdigest()
+    with open(str(src_file), "rb") as src_data:
+        return _get_md5sum_of_bytes(src_data.read(), mode=mode)
+
+
+def _universal_newlines(content: bytes) -> bytes:
+    """Convert all line endings in `content` to '\n', as when reading in text mode, without decoding the contents."""
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return content
+
+
+def _get_md5sum_of_bytes(src_content: bytes, mode="b"):
+    """Returns md5sum of the contents of a file, read in binary mode. See `get_md5sum` for details on `mode`."""
+    if mode == "t":
+        # Note: this is the same as the former text mode read + utf-8 encode, when the locale encoding is utf-8.
+        src_content = _universal_newlines(src_content)
+
+    return hashlib.md5(src_content).hexdigest()
 
 
 def _get_old_file(new_file: Path) -> Path:
@@ -206,6 +218,54 @@ def _smart_move_md5(src_file: Path, dst_file: Path, md5_mode: str = "b"):
     return dst_file
 
 
+def _smart_write_text(dst_file: Path, contents: str, read_only: bool = False) -> bool:
+    """Write `contents` to `dst_file` with utf-8 encoding, only if the file does not already have these contents.
+
+    Contents are compared in memory, ignoring line endings (as the 't' md5 mode does). When they differ, they are
+    written to a `.new` file which is then atomically moved to `dst_file`, so that it is never partially written.
+
+    Parameters
+    ----------
+    dst_file : Path
+        The destination file path.
+
+    contents : str
+        The text to write.
+
+    read_only : bool
+        If True, the file is created read-only.
+
+    Returns
+    -------
+    written : bool
+        True if the file was (re)written, False if it already had the same contents.
+    """
+    dst_exists = dst_file.exists()
+    if dst_exists and _universal_newlines(dst_file.read_bytes()) == _universal_newlines(contents.encode("utf-8")):
+        # Shortcut: destination is already identical
+        return False
+
+    # Write to `<dst_file>.new`, directly with the final permissions
+    new_file = str(_new_file(dst_file))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    mode = 0o444 if read_only else 0o666
+    try:
+        fd = os.open(new_file, flags, mode)
+    except FileExistsError:
+        # A leftover from an interrupted run
+        os.chmod(new_file, stat.S_IWRITE)
+        os.remove(new_file)
+        fd = os.open(new_file, flags, mode)
+    with open(fd, "w", encoding="utf-8") as f:
+        f.write(contents)
+
+    if os.name == "nt" and dst_exists:
+        # Windows can not overwrite a read-only file
+        os.chmod(dst_file, stat.S_IWRITE)
+    os.replace(new_file, dst_file)
+    return True
+
+
 def _new_file(file: Path) -> Path:
     """Return the same file path with a .new additional extension."""
     return file.with_suffix(f"{file.suffix}.new")
@@ -227,7 +287,7 @@ def _replace_by_new_if_needed(file_new: Path, md5_mode: str = "b"):
     _smart_move_md5(src_file=file_new, dst_file=_get_old_file(file_new), md5_mode=md5_mode)
 
 
-def _smart_copy_md5(src_file: Path, dst_file: Path, src_md5: str = None, md5_mode: str = "b") -> Tuple[Path, str]:
+def _smart_copy_md5(src_file: Path, dst_file: Path, src_md5: str = None, md5_mode: str = "b") -> str:
     """Copy `src_file` to `dst_file`, overwriting `dst_file`, only if md5 has changed.
 
     Parameters
@@ -247,7 +307,7 @@ def _smart_copy_md5(src_file: Path, dst_file: Path, src_md5: str = None, md5_mod
     Returns
     -------
     md5 : str
-        The md5 of the file, if it has been provided or computed in the process, or None.
+        The md5 of the source file. It is the provided `src_md5` if any, otherwise it is computed in the process.
     """
     assert src_file.is_absolute() and dst_file.is_absolute()  # noqa
     assert src_file != dst_file  # noqa
@@ -261,8 +321,16 @@ def _smart_copy_md5(src_file: Path, dst_file: Path, src_md5: str = None, md5_mod
             # Shortcut: nothing to do
             return src_md5
 
-    # Proceed to the copy operation
-    copyfile(src_file, dst_file)
+        # Proceed to the copy operation
+        copyfile(src_file, dst_file)
+
+    else:
+        # Proceed to the copy operation, computing the md5 from the same single read of the source
+        src_content = src_file.read_bytes()
+        dst_file.write_bytes(src_content)
+        if src_md5 is None:
+            src_md5 = _get_md5sum_of_bytes(src_content, mode=md5_mode)
+
     assert dst_file.exists()  # noqa
 
     return src_md5
@@ -0,0 +1,50 @@
+#  Authors: Sylvain MARIE <sylvain.marie@se.com>
+#            + All contributors to <https://github.com/smarie/mkdocs-gallery>
+#
+#  Original idea and code: sphinx-gallery, <https://sphinx-gallery.github.io>
+#  License: 3-clause BSD, <https://github.com/smarie/mkdocs-gallery/blob/master/LICENSE>
+"""
+Fixtures shared by the tests
+"""
+import copy
+from typing import Dict
+
+import pytest
+
+from mkdocs_gallery.gen_data_model import AllInformation, Gallery
+from mkdocs_gallery.gen_gallery import DEFAULT_GALLERY_CONF
+
+
+@pytest.fixture
+def gallery_files() -> Dict[str, str]:
+    """The files created by the `gallery` fixture: a map of path relative to the project root to text contents.
+
+    By default a readme, two examples, a local module and an `__init__.py`, in `examples/`. Test modules can override
+    this fixture to create other files.
+    """
+    files = {"examples/README.md": "# Gallery\n"}
+    for name in ("plot_b", "plot_a", "local_module", "__init__"):
+        files[f"examples/{name}.py"] = f"print('{name}')\n"
+    return files
+
+
+@pytest.fixture
+def gallery(tmp_path, gallery_files) -> Gallery:
+    """A gallery with scripts in `examples/`, generated in `docs/generated/gallery`. See `gallery_files`."""
+    docs_dir = tmp_path / "docs"
+    scripts_dir = tmp_path / "examples"
+    scripts_dir.mkdir()
+    for file_name, contents in gallery_files.items():
+        file = tmp_path / file_name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(contents)
+
+    all_info = AllInformation(
+        gallery_conf=copy.deepcopy(DEFAULT_GALLERY_CONF),
+        mkdocs_conf={"docs_dir": str(docs_dir), "site_dir": str(tmp_path / "site")},
+        project_root_dir=tmp_path,
+    )
+    all_info.add_gallery(scripts_dir=scripts_dir, generated_dir=docs_dir / "generated" / "gallery")
+    all_info.populate_subsections()
+
+    yield all_info.galleries[0]
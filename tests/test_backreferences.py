@@ -0,0 +1,118 @@
+#  Authors: Sylvain MARIE <sylvain.marie@se.com>
+#            + All contributors to <https://github.com/smarie/mkdocs-gallery>
+#
+#  Original idea and code: sphinx-gallery, <https://sphinx-gallery.github.io>
+#  License: 3-clause BSD, <https://github.com/smarie/mkdocs-gallery/blob/master/LICENSE>
+"""
+Tests for the backreferences generator
+"""
+from importlib import invalidate_caches
+
+import pytest
+
+from mkdocs_gallery.backreferences import (
+    DummyClass,
+    _from_import,
+    _from_import_cached,
+    _get_short_module_name,
+    identify_names,
+)
+
+
+@pytest.mark.parametrize(
+    "module_name, obj_name, expected",
+    [
+        ("os.path", "join", "os.path"),
+        ("mkdocs_gallery.backreferences", "identify_names", "mkdocs_gallery.backreferences"),
+        ("mkdocs_gallery.gen_data_model", "AllInformation", "mkdocs_gallery.gen_data_model"),
+        ("mkdocs_gallery.gen_data_model", "AllInformation.from_cfg", "mkdocs_gallery.gen_data_model"),
+        ("mkdocs_gallery.gen_data_model", "AllInformation.not_an_attr", None),
+        ("mkdocs_gallery.non_existent", "foo", None),
+    ],
+)
+def test_get_short_module_name(module_name, obj_name, expected):
+    """Test that the shortest module name is found, and that the (cached) result is stable"""
+    assert _get_short_module_name(module_name, obj_name) == expected
+    assert _get_short_module_name(module_name, obj_name) == expected
+
+
+def test_from_import_failure_is_cached():
+    """Test that a failed import raises an ImportError, every time"""
+    for _ in range(2):
+        with pytest.raises(ImportError):
+            _from_import("mkdocs_gallery.non_existent", "foo")
+        with pytest.raises(ImportError):
+            _from_import("mkdocs_gallery", "non_existent")
+
+
+def test_from_import_cache_clear(tmp_path, monkeypatch):
+    """Test that a module created after a failed import is found once the cache is cleared, as done for each build"""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    with pytest.raises(ImportError):
+        _from_import("mkdocs_gallery_tmp_mod", "foo")
+    assert _get_short_module_name("mkdocs_gallery_tmp_mod", "foo") is None
+
+    (tmp_path / "mkdocs_gallery_tmp_mod.py").write_text("foo = 1\n")
+    invalidate_caches()
+    _from_import_cached.cache_clear()
+    _get_short_module_name.cache_clear()
+    assert _from_import("mkdocs_gallery_tmp_mod", "foo") == 1
+    assert _get_short_module_name("mkdocs_gallery_tmp_mod", "foo") == "mkdocs_gallery_tmp_mod"
+
+
+def test_identify_names_from_text():
+    """Test that the names referenced with roles in the text blocks are found"""
+    script_blocks = [
+        ("text", "See :func:`os.path.join` and also :class:`~collections.OrderedDict`, but not os.getcwd", 1),
+        ("code", "a = 1\n", 2),
+        ("text", "no role here", 3),
+    ]
+    res = identify_names(script_blocks)
+    assert list(res) == ["os.path.join", "collections.OrderedDict"]
+    assert res["os.path.join"] == [{"name": "join", "module": "os.path", "module_short": "os.path", "is_class": False}]
+    assert res["collections.OrderedDict"][0]["module"] == "collections"
+
+
+def test_identify_names_from_code():
+    """Test that the names used in the code are resolved through the imports, including dotted ones"""
+    code = """
+import os.path
+import collections as col
+from os import getcwd
+print(len(col.OrderedDict()), os.path.join("a", "b"), getcwd(), col)
+x = 1
+x.real
+"""
+    script_blocks = [("code", code, 1)]
+    res = identify_names(script_blocks)
+    assert set(res) == {"os.path.join", "col.OrderedDict", "getcwd", "col"}
+    assert res["col.OrderedDict"][0]["module"] == "collections"
+    assert res["getcwd"][0]["module"] == "os"
+    assert res["os.path.join"][0]["module"] == "os.path"
+
+
+def test_identify_names_from_globals():
+    """Test that the names used in the code are resolved by inspection of the global variables"""
+
+    code = "d = DummyClass()\nd.run()\nd.prop\n"
+    global_variables = {"DummyClass": DummyClass, "d": DummyClass()}
+    res = identify_names([("code", code, 1)], global_variables=global_variables)
+
+    mod = "mkdocs_gallery.backreferences"
+    assert {"name": "DummyClass", "module": mod, "module_short": mod, "is_class": True} in res["DummyClass"]
+
+    # a method and a property of a class instance
+    for name in ("run", "prop"):
+        full_names = [(c["module"], c["name"]) for c in res[f"d.{name}"]]
+        assert (mod, f"DummyClass.{name}") in full_names
+        assert ("builtins", f"object.{name}") not in full_names
+
+
+def test_identify_names_no_duplicates():
+    """Test that a name found several times (in code and text) leads to a single guess"""
+    script_blocks = [
+        ("text", "See :func:`os.getcwd`, :func:`os.getcwd` and :func:`~os.getcwd`", 1),
+        ("code", "import os\nos.getcwd()\nos.getcwd()\n", 2),
+    ]
+    res = identify_names(script_blocks)
+    assert res["os.getcwd"] == [{"name": "getcwd", "module": "os", "module_short": "os", "is_class": False}]
@@ -0,0 +1,98 @@
+#  Authors: Sylvain MARIE <sylvain.marie@se.com>
+#            + All contributors to <https://github.com/smarie/mkdocs-gallery>
+#
+#  Original idea and code: sphinx-gallery, <https://sphinx-gallery.github.io>
+#  License: 3-clause BSD, <https://github.com/smarie/mkdocs-gallery/blob/master/LICENSE>
+"""
+Tests for the binder utilities
+"""
+from pathlib import Path, PurePosixPath
+from types import SimpleNamespace
+
+import pytest
+
+from mkdocs_gallery.binder import _list_ipynb_to_mirror, check_binder_conf, gen_binder_url
+from mkdocs_gallery.errors import ConfigError
+
+
+@pytest.mark.parametrize(
+    "extra_conf, expected",
+    [
+        (dict(), "https://mybinder.org/v2/gh/org/repo/gh-pages?filepath=notebooks/gallery/plot_a.ipynb"),
+        (
+            dict(use_jupyter_lab=True),
+            "https://mybinder.org/v2/gh/org/repo/gh-pages?urlpath=lab/tree/notebooks/gallery/plot_a.ipynb",
+        ),
+        (
+            dict(filepath_prefix="/site/"),
+            "https://mybinder.org/v2/gh/org/repo/gh-pages?filepath=site/notebooks/gallery/plot_a.ipynb",
+        ),
+        (dict(notebooks_dir=""), "https://mybinder.org/v2/gh/org/repo/gh-pages?filepath=gallery/plot_a.ipynb"),
+    ],
+)
+def test_gen_binder_url(extra_conf, expected):
+    """Test that the binder url is correct, whatever the configuration"""
+    binder_conf = dict(
+        binderhub_url="https://mybinder.org", org="org", repo="repo", branch="gh-pages", notebooks_dir="notebooks"
+    )
+    binder_conf.update(extra_conf)
+    script = SimpleNamespace(ipynb_file_rel_site_root=PurePosixPath("gallery/plot_a.ipynb"))
+
+    # several times, so that the cached parts are used
+    for _ in range(2):
+        assert gen_binder_url(script, binder_conf) == expected
+
+
+def test_list_ipynb_to_mirror(tmpdir):
+    """Test that only the notebooks are listed, keeping the structure but skipping the images folders"""
+    src = Path(str(tmpdir)) / "src"
+    for f in ("a.ipynb", "a.py", "images/b.ipynb", "sub/c.ipynb", "sub/images/d.png", "sub/sub2/e.py"):
+        (src / f).parent.mkdir(parents=True, exist_ok=True)
+        (src / f).write_text(f)
+
+    dst = Path(str(tmpdir)) / "dst"
+    copies = []
+    _list_ipynb_to_mirror(str(src), str(dst), copies)
+
+    assert sorted((Path(s).relative_to(src).as_posix(), Path(d).relative_to(dst).as_posix()) for s, d in copies) == [
+        ("a.ipynb", "a.ipynb"),
+        ("sub/c.ipynb", "sub/c.ipynb"),
+    ]
+
+    # Only the destination dirs that will receive a notebook have been created
+    assert sorted(p.relative_to(dst).as_posix() for p in dst.rglob("*")) == ["sub"]
+
+
+@pytest.mark.parametrize(
+    "binder_conf, error",
+    [
+        (dict(repo=None, dependencies=None), "binder_conf is missing values for: ['repo', 'dependencies']"),
+        (dict(foo=1), "Unknown Binder config keys: ['foo']"),
+        (
+            dict(repo=None, foo=1, bar=2),
+            "binder_conf is missing values for: ['repo']; Unknown Binder config keys: ['bar', 'foo']",
+        ),
+        (dict(binderhub_url="mybinder.org"), "did not supply a valid url"),
+        (dict(dependencies=["setup.py"]), "Did not find one of `requirements.txt` or `environment.yml`"),
+    ],
+)
+def test_check_binder_conf_errors(binder_conf, error):
+    """Test that the invalid binder configurations are detected"""
+    conf = dict(
+        binderhub_url="https://mybinder.org", org="org", repo="repo", branch="main", dependencies="requirements.txt"
+    )
+    conf.update(binder_conf)
+    with pytest.raises(ConfigError) as exc_info:
+        check_binder_conf(conf)
+    assert error in str(exc_info.value)
+
+
+def test_check_binder_conf():
+    """Test that a valid binder configuration is normalized"""
+    conf = dict(
+        binderhub_url="https://mybinder.org", org="org", repo="repo", branch="main", dependencies="env/Dockerfile"
+    )
+    assert check_binder_conf(conf) is conf
+    assert conf["dependencies"] == ["env/Dockerfile"]
+    assert conf["notebooks_dir"] == "notebooks"
+    assert check_binder_conf(None) == {}
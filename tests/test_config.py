@@ -1,8 +1,12 @@
+import os
 import pytest
 from pathlib import Path
 
-from mkdocs.config import load_config
-from mkdocs_gallery.plugin import GalleryPlugin
+from mkdocs.config import config_options as co, load_config
+from mkdocs.config.base import ValidationError
+from mkdocs.structure.files import File, Files
+from mkdocs_gallery.gen_gallery import _as_tuple
+from mkdocs_gallery.plugin import ConfigList, GalleryPlugin, merge_extra_config
 from mkdocs.utils import yaml_load
 
 
@@ -118,3 +122,115 @@ image_srcset: ['2x']
 
     assert isinstance(plugin.config, dict)
     assert len(plugin.config) > 0
+
+
+def test_merge_extra_config():
+    """Test that extra markdown extensions and options are added, without overriding the user's ones"""
+
+    config = {
+        "markdown_extensions": ["toc", "admonition", "pymdownx.emoji"],
+        "mdx_configs": {"toc": {"permalink": True}, "pymdownx.emoji": {"emoji_index": "user_index"}},
+    }
+    extra_config = {
+        "markdown_extensions": [
+            "admonition",
+            "attr_list",
+            {"toc": {"permalink": False, "toc_depth": 2}},
+            {"pymdownx.emoji": {"emoji_index": "our_index", "emoji_generator": "our_generator"}},
+            {"pymdownx.highlight": {"linenums": True}},
+        ]
+    }
+    merge_extra_config(extra_config, config)
+
+    assert config["markdown_extensions"] == ["toc", "admonition", "pymdownx.emoji", "attr_list", "pymdownx.highlight"]
+    assert config["mdx_configs"] == {
+        "toc": {"permalink": True, "toc_depth": 2},
+        "pymdownx.emoji": {"emoji_index": "user_index", "emoji_generator": "our_generator"},
+        "pymdownx.highlight": {"linenums": True},
+    }
+
+
+def test_on_serve_ignores_generated_dirs(tmp_root_dir):
+    """Test that the file system events in the generated dirs are ignored when serving"""
+
+    gallery_dir = tmp_root_dir / "docs" / "generated" / "gallery"
+    backrefs_dir = tmp_root_dir / "docs" / "generated" / "backreferences"
+
+    class Event:
+        def __init__(self, src_path):
+            self.src_path = str(src_path)
+
+    class Handler:
+        def __init__(self):
+            self.received = []
+            self.on_any_event = lambda event: self.received.append(event.src_path)
+
+    handler = Handler()
+    server = type("Server", (), {})()
+    server.observer = type("Observer", (), {})()
+    server.observer._handlers = {"watch": {handler}}
+
+    plugin = GalleryPlugin()
+    plugin.config = {"gallery_dirs": [gallery_dir], "backreferences_dir": backrefs_dir}
+    plugin.on_serve(server, config=None, builder=None)
+
+    # Serving again (e.g. on config reload) replaces the wrapper instead of wrapping it again
+    first_wrapper = handler.on_any_event
+    plugin.on_serve(server, config=None, builder=None)
+    assert handler.on_any_event._mkdocs_gallery_original is first_wrapper._mkdocs_gallery_original
+
+    for ignored in (gallery_dir, gallery_dir / "index.md", backrefs_dir / "foo.examples"):
+        handler.on_any_event(Event(ignored))
+    kept = [tmp_root_dir / "docs" / "index.md", tmp_root_dir / "docs" / "generated" / "gallery2" / "index.md"]
+    for path in kept:
+        handler.on_any_event(Event(path))
+
+    assert handler.received == [str(p) for p in kept]
+    assert plugin.config["gallery_dirs"] == [gallery_dir]
+
+
+def test_config_list_errors():
+    """Test that ConfigList reports all the invalid items at once"""
+
+    opt = ConfigList(co.Type(int))
+    assert opt.validate([1, 2]) == [1, 2]
+    assert opt.validate(3) == [3]
+    with pytest.raises(ValidationError, match="Error validating config item #1: "):
+        opt.validate("a")
+
+    with pytest.raises(ValidationError) as exc_info:
+        opt.validate([1, "a", 2, "b"])
+    assert str(exc_info.value).startswith("Error validating config item #2: ")
+    assert "; Error validating config item #4: " in str(exc_info.value)
+
+    with pytest.raises(ValidationError):
+        ConfigList(co.Type(int), single_elt_allowed=False).validate(3)
+
+
+def test_on_files_excludes_examples_dirs(tmp_root_dir):
+    """Test that the files in the gallery source dirs are removed from the site, and only those"""
+
+    docs_dir = tmp_root_dir / "docs"
+    paths = ["index.md", "examples/README.md", "examples/sub/README.md", "examples2/index.md", "examplesfoo.md"]
+
+    plugin = GalleryPlugin()
+    plugin.config = {"examples_dirs": [docs_dir / "examples"], "binder": None}
+    plugin.conf_script = None
+    site_dir = tmp_root_dir / "site"
+    files = Files([File(p, src_dir=str(docs_dir), dest_dir=str(site_dir), use_directory_urls=True) for p in paths])
+    result = plugin.on_files(files, config={"docs_dir": str(docs_dir)})
+
+    assert [f.src_path.replace(os.sep, "/") for f in result] == ["index.md", "examples2/index.md", "examplesfoo.md"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("docs/examples", ("docs/examples",)),
+        (["docs/a", "docs/b"], ("docs/a", "docs/b")),
+        (("docs/a",), ("docs/a",)),
+    ],
+)
+def test_as_tuple(value, expected):
+    """Test that the examples and gallery dirs are normalized as tuples"""
+    assert _as_tuple(value) == expected
@@ -0,0 +1,122 @@
+#  Authors: Sylvain MARIE <sylvain.marie@se.com>
+#            + All contributors to <https://github.com/smarie/mkdocs-gallery>
+#
+#  Original idea and code: sphinx-gallery, <https://sphinx-gallery.github.io>
+#  License: 3-clause BSD, <https://github.com/smarie/mkdocs-gallery/blob/master/LICENSE>
+"""
+Tests for the downloadable zip files
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from mkdocs_gallery import downloads
+from mkdocs_gallery.downloads import python_zip, python_zip_multi
+
+
+@pytest.fixture
+def gallery_files() -> Dict[str, str]:
+    """Two examples, already generated in `docs/generated/gallery`"""
+    files = {}
+    for name in ("plot_a", "plot_b"):
+        files[f"docs/generated/gallery/{name}.py"] = f"print('{name}')\n"
+        files[f"docs/generated/gallery/{name}.ipynb"] = "{}\n"
+    return files
+
+
+@pytest.mark.parametrize("extension", [".py", ".ipynb"])
+def test_python_zip(gallery, extension):
+    """Test that the zip contains all files with the right extension, and that it is not rebuilt if not needed"""
+
+    file_list = gallery.list_downloadable_sources()
+    zipfile = python_zip(file_list, gallery, extension=extension)
+
+    with ZipFile(str(zipfile)) as zipf:
+        assert sorted(zipf.namelist()) == [f"plot_a{extension}", f"plot_b{extension}"]
+        assert all(zinfo.compress_type == ZIP_DEFLATED for zinfo in zipf.infolist())
+
+    # Nothing changed: the zip is not rebuilt
+    zipfile.write_bytes(b"dummy")
+    assert python_zip(file_list, gallery, extension=extension) == zipfile
+    assert zipfile.read_bytes() == b"dummy"
+
+    # A source file changed: the zip is rebuilt
+    (gallery.generated_dir / f"plot_a{extension}").write_text("# modified, longer contents\n")
+    python_zip(file_list, gallery, extension=extension)
+    with ZipFile(str(zipfile)) as zipf:
+        assert zipf.read(f"plot_a{extension}") == b"# modified, longer contents\n"
+
+
+def test_python_zip_multi(gallery):
+    """Test that both zips are created in a single call, and that only the outdated one is rebuilt"""
+
+    file_list = gallery.list_downloadable_sources()
+    zip_py, zip_ipynb = python_zip_multi(file_list, gallery, extensions=(".py", ".ipynb"))
+    assert (zip_py, zip_ipynb) == (gallery.zipfile_python, gallery.zipfile_jupyter)
+
+    for zipfile, extension in ((zip_py, ".py"), (zip_ipynb, ".ipynb")):
+        with ZipFile(str(zipfile)) as zipf:
+            assert sorted(zipf.namelist()) == [f"plot_a{extension}", f"plot_b{extension}"]
+
+    # Only the notebooks changed: only the jupyter zip is rebuilt
+    zip_py.write_bytes(b"dummy")
+    (gallery.generated_dir / "plot_b.ipynb").write_text('{"modified": true}\n')
+    python_zip_multi(file_list, gallery, extensions=(".py", ".ipynb"))
+    assert zip_py.read_bytes() == b"dummy"
+    with ZipFile(str(zip_ipynb)) as zipf:
+        assert zipf.read("plot_b.ipynb") == b'{"modified": true}\n'
+
+
+def test_python_zip_interrupted(gallery, monkeypatch):
+    """Test that a zip partially written after its deletion is not reused thanks to the manifest left over"""
+
+    file_list = gallery.list_downloadable_sources()
+    zipfile = python_zip(file_list, gallery, extension=".py")
+
+    # The zip is deleted but not its manifest, and the next build is interrupted while writing it
+    zipfile.unlink()
+
+    def _read_zip_entry_interrupted(file_src, arcname):
+        raise KeyboardInterrupt()
+
+    with monkeypatch.context() as m:
+        m.setattr(downloads, "_read_zip_entry", _read_zip_entry_interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            python_zip(file_list, gallery, extension=".py")
+    assert zipfile.exists()
+
+    # The partial zip is rebuilt
+    python_zip(file_list, gallery, extension=".py")
+    with ZipFile(str(zipfile)) as zipf:
+        assert sorted(zipf.namelist()) == ["plot_a.py", "plot_b.py"]
+
+
+def test_bounded_map():
+    """Test that `_bounded_map` returns the results in order, with a bounded number of calls in advance"""
+
+    consumed = []
+
+    def _fn(i):
+        # the number of calls in advance of the consumer never exceeds the bound
+        assert i - len(consumed) <= 3
+        return i * 2
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for res in downloads._bounded_map(executor, _fn, range(20), max_pending=3):
+            consumed.append(res)
+
+    assert consumed == [i * 2 for i in range(20)]
+
+
+def test_python_zip_isal(gallery):
+    """Test that the zip is valid when built with the isal_zlib backend"""
+
+    pytest.importorskip("isal")
+    gallery.conf["isal_zlib"] = True
+
+    zipfile = python_zip(gallery.list_downloadable_sources(), gallery, extension=".py")
+    with ZipFile(str(zipfile)) as zipf:
+        assert zipf.testzip() is None
+        assert zipf.read("plot_a.py") == b"print('plot_a')\n"
@@ -0,0 +1,346 @@
+#  Authors: Sylvain MARIE <sylvain.marie@se.com>
+#            + All contributors to <https://github.com/smarie/mkdocs-gallery>
+#
+#  Original idea and code: sphinx-gallery, <https://sphinx-gallery.github.io>
+#  License: 3-clause BSD, <https://github.com/smarie/mkdocs-gallery/blob/master/LICENSE>
+"""
+Tests for the gallery data model
+"""
+import copy
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from mkdocs_gallery.errors import ExtensionError
+from mkdocs_gallery.gen_data_model import AllInformation, GalleryScript, _get_readme
+from mkdocs_gallery.gen_gallery import DEFAULT_GALLERY_CONF
+from mkdocs_gallery.sorting import ExplicitOrder
+from mkdocs_gallery.utils import _new_file, get_md5sum
+
+
+def test_patterns(gallery):
+    """Test that the filename and ignore patterns are applied, and follow configuration changes"""
+    gallery.collect_script_files(sort_files=False)
+    gallery.scripts.sort(key=lambda s: s.script_stem)
+    assert [s.script_stem for s in gallery.scripts] == ["local_module", "plot_a", "plot_b"]
+    assert [s.is_executable_example() for s in gallery.scripts] == [False, True, True]
+
+    # the compiled pattern is reused...
+    all_info = gallery.all_info
+    assert all_info.get_compiled_pattern("filename_pattern") is all_info.get_compiled_pattern("filename_pattern")
+
+    # ...but not if the option changes
+    all_info.gallery_conf["filename_pattern"] = "local"
+    assert [s.is_executable_example() for s in gallery.scripts] == [True, False, False]
+    assert not gallery.is_ignored_script_file(gallery.scripts_dir / "local_module.py")
+    all_info.gallery_conf["ignore_pattern"] = "local"
+    assert gallery.is_ignored_script_file(gallery.scripts_dir / "local_module.py")
+
+    # no script is executed when plot_gallery is False
+    all_info.gallery_conf["plot_gallery"] = False
+    assert [s.is_executable_example() for s in gallery.scripts] == [False, False, False]
+
+
+def test_all_info_dirs(gallery):
+    """Test the (cached) mkdocs and backreferences dirs"""
+    all_info = gallery.all_info
+    assert all_info.mkdocs_docs_dir is all_info.mkdocs_docs_dir
+    assert all_info.mkdocs_site_dir == all_info.project_root_dir / "site"
+
+    all_info.gallery_conf["backreferences_dir"] = str(all_info.mkdocs_docs_dir / "backrefs")
+    assert all_info.get_backreferences_file("os.path") == all_info.mkdocs_docs_dir / "backrefs" / "os.path.examples"
+    assert all_info.backrefs_dir is all_info.backrefs_dir
+
+
+def test_script_paths(gallery):
+    """Test the (cached) paths of a gallery script"""
+    gallery.collect_script_files(sort_files=False)
+    script = next(s for s in gallery.scripts if s.script_stem == "plot_a")
+
+    for _ in range(2):
+        assert script.src_py_file == gallery.scripts_dir / "plot_a.py"
+        assert script._src_py_file_str == str(gallery.scripts_dir / "plot_a.py")
+        assert script.dwnld_py_file == gallery.generated_dir / "plot_a.py"
+        assert script.md5_file == gallery.generated_dir / "plot_a.py.md5"
+        assert script.md_file == gallery.generated_dir / "plot_a.md"
+        assert script.ipynb_file == gallery.generated_dir / "plot_a.ipynb"
+        assert script.codeobj_file == gallery.generated_dir / "plot_a_codeobj.pickle"
+        assert script.get_image_path(2) == gallery.images_dir / script.image_name_template.format(2)
+        assert script.get_image_path(1234) == gallery.images_dir / "mkd_glr_plot_a_1234.png"
+        assert script.get_thumbnail_file(".png") == gallery.thumb_dir / "mkd_glr_plot_a_thumb.png"
+        assert script.get_thumbnail_file(".svg") == gallery.thumb_dir / "mkd_glr_plot_a_thumb.svg"
+
+        # relative paths
+        assert script.src_py_file_rel_project == Path("examples/plot_a.py")
+        assert gallery.generated_dir_rel_site_root == Path("generated/gallery")
+        assert script.dwnld_py_file_rel_site_root == Path("generated/gallery/plot_a.py")
+        assert script.ipynb_file_rel_site_root == Path("generated/gallery/plot_a.ipynb")
+        assert script.md_file_rel_site_root == Path("generated/gallery/plot_a.md")
+        assert script.md_file_rel_root_gallery == Path("plot_a.md")
+
+    assert repr(script).startswith("GalleryScript(script_stem='plot_a',")
+
+
+def test_make_dwnld_py_files(gallery):
+    """Test that all scripts are copied at once in the generated dir, with their md5 computed along the way"""
+    gallery.collect_script_files(sort_files=False)
+    gallery.make_generated_dir()
+    gallery.make_dwnld_py_files()
+
+    for script in gallery.scripts:
+        assert script.dwnld_py_file.read_text() == script.src_py_file.read_text()
+        assert script._py_file_md5 == get_md5sum(script.src_py_file, mode="t")
+
+    # Subsequent calls do nothing
+    script.dwnld_py_file.write_text("modified")
+    script.make_dwnld_py_file()
+    assert script.dwnld_py_file.read_text() == "modified"
+
+
+@pytest.mark.parametrize(
+    "file_names, expected",
+    [
+        (("README.md", "readme.txt"), "readme.txt"),
+        (("Readme.md", "plot_a.py"), "Readme.md"),
+        (("README.rst",), None),
+    ],
+)
+def test_get_readme(tmp_path, file_names, expected):
+    """Test that the readme file is found, in the order of preference of the file names"""
+    dir_ = tmp_path
+    for f in file_names:
+        (dir_ / f).write_text("# Readme\n")
+    # a folder is not a readme
+    (dir_ / "README.txt").mkdir()
+
+    assert _get_readme(dir_, raise_error=False) == (None if expected is None else dir_ / expected)
+    if expected is None:
+        with pytest.raises(ExtensionError):
+            _get_readme(dir_)
+
+
+def test_subsections_readme(gallery):
+    """Test that the subsections are the subfolders with a readme, and that their readme is known"""
+    sub = gallery.scripts_dir / "sub"
+    (sub / "images").mkdir(parents=True)
+    (sub / "README.md").write_text("# Sub\n")
+
+    gallery.subsections = None
+    gallery.populate_subsections()
+    assert [s.subpath for s in gallery.subsections] == [Path("sub")]
+    assert gallery.subsections[0]._readme_file == sub / "README.md"
+
+    subsection = gallery.subsections[0]
+    for _ in range(2):
+        assert subsection.scripts_dir == sub
+        assert subsection.scripts_dir_rel_project == Path("examples/sub")
+        assert subsection.generated_dir == gallery.generated_dir / "sub"
+        assert subsection.generated_dir_rel_project == Path("docs/generated/gallery/sub")
+        assert subsection.generated_dir_rel_site_root == Path("generated/gallery/sub")
+    assert repr(subsection) == f"GallerySubSection(subpath={Path('sub')!r})"
+
+
+def test_subsections_order(gallery):
+    """Test that the subsections are sorted according to the 'subsection_order' option"""
+    for name in ("sub_a", "sub_b", "sub_c"):
+        (gallery.scripts_dir / name).mkdir()
+        (gallery.scripts_dir / name / "README.md").write_text(f"# {name}\n")
+
+    gallery.subsections = None
+    gallery.populate_subsections()
+    assert [s.subpath for s in gallery.subsections] == [Path("sub_a"), Path("sub_b"), Path("sub_c")]
+
+    gallery.conf["subsection_order"] = ExplicitOrder(["sub_b", "sub_c", "sub_a"])
+    gallery.subsections = None
+    gallery.populate_subsections()
+    assert [s.subpath for s in gallery.subsections] == [Path("sub_b"), Path("sub_c"), Path("sub_a")]
+
+
+def test_get_all_script_files(gallery):
+    """Test that the script files of a gallery and its subsections are all listed, the gallery's first"""
+    sub = gallery.scripts_dir / "sub"
+    sub.mkdir()
+    (sub / "README.md").write_text("# Sub\n")
+    (sub / "plot_c.py").write_text("print('plot_c')\n")
+
+    gallery.subsections = None
+    gallery.populate_subsections()
+    gallery.collect_script_files(sort_files=False)
+
+    own_files = sorted(gallery.scripts_dir / f"{n}.py" for n in ("local_module", "plot_a", "plot_b"))
+    all_files = gallery.get_all_script_files()
+    assert sorted(all_files[:3]) == own_files
+    assert all_files[3:] == [sub / "plot_c.py"]
+    assert sorted(gallery.get_all_script_files(recurse=False)) == own_files
+    assert gallery.all_info.get_all_script_files() == all_files
+
+
+def test_is_up_to_date(gallery):
+    """Test that a script is up to date only if its md5 was persisted and its generated files exist"""
+    gallery.collect_script_files(sort_files=False)
+    gallery.make_generated_dir()
+    script = next(s for s in gallery.scripts if s.script_stem == "plot_a")
+    script.make_dwnld_py_file()
+    assert not script.is_up_to_date()
+
+    script.write_final_md5_file()
+    script.md_file.write_text("# plot_a\n")
+    assert not script.is_up_to_date()
+
+    script.ipynb_file.write_text("{}\n")
+    assert script.is_up_to_date()
+
+    script.md_file.unlink()
+    assert not script.is_up_to_date()
+
+
+def test_md5_file_stat(gallery, monkeypatch):
+    """Test that the script is not hashed again if its size and modification time did not change"""
+    gallery.collect_script_files(sort_files=False)
+    gallery.make_generated_dir()
+    script = next(s for s in gallery.scripts if s.script_stem == "plot_a")
+    script.make_dwnld_py_file()
+    script.write_final_md5_file()
+
+    st = script.src_py_file.stat()
+    md5 = get_md5sum(script.src_py_file, mode="t")
+    assert script.md5_file.read_text() == f"{st.st_size}:{st.st_mtime_ns}:{md5}"
+
+    # A new object reads the persisted md5: the script is not hashed
+    def fail(*args, **kwargs):
+        raise AssertionError("the script should not be hashed")
+
+    monkeypatch.setattr("mkdocs_gallery.gen_data_model.get_md5sum", fail)
+    script = GalleryScript(gallery, script.src_py_file)
+    assert not script.has_changed_wrt_persisted_md5()
+    assert script.py_file_md5 == md5
+    monkeypatch.undo()
+
+    # Legacy md5-only format: the script is hashed
+    script.md5_file.write_text(md5)
+    script = GalleryScript(gallery, script.src_py_file)
+    assert not script.has_changed_wrt_persisted_md5()
+
+    # The script changed: the md5 is different
+    script.src_py_file.write_text("print('modified')\n")
+    script = GalleryScript(gallery, script.src_py_file)
+    assert script.has_changed_wrt_persisted_md5()
+
+
+def test_generate_n_dummy_images(gallery):
+    """Test that the dummy images are created from the stock image, without overwriting existing ones"""
+    gallery.collect_script_files(sort_files=False)
+    script = next(s for s in gallery.scripts if s.script_stem == "plot_a")
+    script.init_before_processing()
+
+    stock_img = gallery.scripts_dir / "stock.png"
+    stock_img.write_bytes(b"stock")
+    existing = script.get_image_path(2)
+    existing.write_bytes(b"existing")
+
+    script.generate_n_dummy_images(img=str(stock_img), nb=3)
+    assert [script.get_image_path(i).read_bytes() for i in (1, 2, 3)] == [b"stock", b"existing", b"stock"]
+    assert not script.get_image_path(4).exists()
+
+
+def test_image_path_iterator(gallery):
+    """Test that the image paths are numbered from 1, remembered, and that their number is capped"""
+    gallery.collect_script_files(sort_files=False)
+    script = next(s for s in gallery.scripts if s.script_stem == "plot_a")
+    script.init_before_processing()
+    image_path_iterator = script.run_vars.image_path_iterator
+
+    assert [p for _, p in zip(range(2), image_path_iterator)] == [script.get_image_path(i) for i in (1, 2)]
+    assert next(image_path_iterator) == script.get_image_path(3)
+    assert next(iter(image_path_iterator)) == script.get_image_path(4)
+    assert len(image_path_iterator) == 4
+    assert image_path_iterator.paths[-1] == script.get_image_path(4)
+
+    image_path_iterator._stop = 5
+    with pytest.raises(ExtensionError, match="Generated over 5 images"):
+        list(image_path_iterator)
+    assert len(image_path_iterator) == 5
+
+
+def test_save_md_example(gallery):
+    """Test that the markdown file is saved read-only, and replaced only when its contents change"""
+    gallery.collect_script_files(sort_files=False)
+    gallery.make_generated_dir()
+    script = next(s for s in gallery.scripts if s.script_stem == "plot_a")
+
+    script.save_md_example("# plot_a\n")
+    assert script.md_file.read_text() == "# plot_a\n"
+    assert script.md_file.stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH) == 0
+    assert script.md_file.stat().st_mode & stat.S_IRUSR
+
+    mtime_ns = script.md_file.stat().st_mtime_ns
+    script.save_md_example("# plot_a\n")
+    assert script.md_file.stat().st_mtime_ns == mtime_ns
+
+    script.save_md_example("# plot_a, modified\n")
+    assert script.md_file.read_text() == "# plot_a, modified\n"
+    assert not _new_file(script.md_file).exists()
+
+
+def test_script_checks(gallery):
+    """Test that a script can only be created from a .py file in the gallery scripts dir"""
+    script = GalleryScript(gallery, gallery.scripts_dir / "plot_a.py")
+    assert script.script_stem == "plot_a"
+    if __debug__:
+        with pytest.raises(AssertionError):
+            GalleryScript(gallery, gallery.scripts_dir / "sub" / "plot_a.py")
+        with pytest.raises(AssertionError):
+            GalleryScript(gallery, gallery.scripts_dir / "README.md")
+
+
+def test_all_info_collect_script_files(gallery):
+    """Test that the scripts of all galleries and their subsections are collected, in order"""
+    all_info = gallery.all_info
+    sub = gallery.scripts_dir / "sub"
+    sub.mkdir()
+    (sub / "README.md").write_text("# Sub\n")
+    (sub / "plot_c.py").write_text("print('plot_c')\n")
+    gallery.subsections = None
+
+    other_dir = all_info.project_root_dir / "other_examples"
+    other_dir.mkdir()
+    (other_dir / "README.md").write_text("# Other\n")
+    (other_dir / "plot_d.py").write_text("print('plot_d')\n")
+    all_info.add_gallery(scripts_dir=other_dir, generated_dir=all_info.mkdocs_docs_dir / "generated" / "other")
+
+    all_info.populate_subsections()
+    all_info.collect_script_files(sort_files=False)
+
+    assert [s.script_stem for s in gallery.subsections[0].scripts] == ["plot_c"]
+    assert [s.script_stem for s in all_info.galleries[1].scripts] == ["plot_d"]
+    all_info.prefetch_script_stats()
+    st = os.stat(str(other_dir / "plot_d.py"))
+    assert all_info.galleries[1].scripts[0]._src_stat == (st.st_size, st.st_mtime_ns)
+
+    all_files = all_info.get_all_script_files()
+    assert list(all_info.iter_all_script_files()) == all_files
+    assert len(all_files) == 5
+    assert all_files[-2:] == [sub / "plot_c.py", other_dir / "plot_d.py"]
+
+
+def test_from_cfg(tmp_path, monkeypatch):
+    """Test the project root dir (the current dir, and of the mkdocs config file) and the backreferences dir"""
+    root = tmp_path
+    (root / "sub").mkdir()
+    gallery_conf = dict(copy.deepcopy(DEFAULT_GALLERY_CONF), examples_dirs=[], gallery_dirs=[])
+    mkdocs_conf = {"config_file_path": str(root / "mkdocs.yml"), "docs_dir": str(root / "docs"), "site_dir": "site"}
+
+    monkeypatch.chdir(str(root))
+    assert AllInformation.from_cfg(gallery_conf, mkdocs_conf).project_root_dir == root
+
+    # the backreferences dir is created if needed
+    gallery_conf["backreferences_dir"] = str(root / "docs" / "backrefs")
+    for _ in range(2):
+        AllInformation.from_cfg(gallery_conf, mkdocs_conf)
+        assert (root / "docs" / "backrefs").is_dir()
+
+    monkeypatch.chdir(str(root / "sub"))
+    with pytest.raises(ValueError, match="ambiguous"):
+        AllInformation.from_cfg(gallery_conf, mkdocs_conf)
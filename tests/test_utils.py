@@ -1,8 +1,15 @@
+import hashlib
 from pathlib import Path
 import re
 import os
 import pytest
-from mkdocs_gallery.utils import matches_filepath_pattern, is_relative_to
+from mkdocs_gallery.utils import (
+    _smart_copy_md5,
+    _smart_write_text,
+    get_md5sum,
+    is_relative_to,
+    matches_filepath_pattern,
+)
 
 
 class TestFilepathPatternMatch:
@@ -67,3 +74,58 @@ class TestRelativePaths:
 
         with pytest.raises(TypeError):
             is_relative_to(path1, path2)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_get_md5sum_text_mode(tmpdir, newline):
+    """Test that in text mode, the md5 does not depend on line endings and is the same as decoding/encoding"""
+    contents = "# comment \u00e9\nprint('hello')\n\nprint('world')\n"
+    f = Path(str(tmpdir)) / "test.py"
+    f.write_bytes(contents.replace("\n", newline).encode("utf-8"))
+
+    with open(str(f), "rt", encoding="utf-8") as f_:
+        expected = hashlib.md5(f_.read().encode("utf-8")).hexdigest()
+    assert get_md5sum(f, mode="t") == expected
+
+    # binary mode is the md5 of the raw bytes
+    assert get_md5sum(f, mode="b") == hashlib.md5(f.read_bytes()).hexdigest()
+
+
+def test_smart_copy_md5(tmpdir):
+    """Test that the file is copied only if needed, and that the source md5 is returned"""
+    src, dst = Path(str(tmpdir)) / "src.py", Path(str(tmpdir)) / "dst.py"
+    src.write_bytes(b"print('hello')\r\n")
+    expected_md5 = get_md5sum(src, mode="t")
+
+    # first copy: the md5 is computed during the copy
+    assert _smart_copy_md5(src, dst, md5_mode="t") == expected_md5
+    assert dst.read_bytes() == src.read_bytes()
+
+    # identical destination: not touched, even if the provided md5 is used
+    dst_mtime = os.stat(str(dst)).st_mtime_ns
+    assert _smart_copy_md5(src, dst, src_md5=expected_md5, md5_mode="t") == expected_md5
+    assert os.stat(str(dst)).st_mtime_ns == dst_mtime
+
+    # modified destination: overwritten
+    dst.write_bytes(b"modified")
+    assert _smart_copy_md5(src, dst, md5_mode="t") == expected_md5
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_smart_write_text(tmpdir):
+    """Test that the file is written only if its contents change, and atomically"""
+    dst = Path(str(tmpdir)) / "dst.md"
+    assert _smart_write_text(dst, "# title\n", read_only=True)
+    assert dst.read_text(encoding="utf-8") == "# title\n"
+    assert not os.stat(str(dst)).st_mode & 0o222
+
+    # identical contents, up to the line endings: not touched
+    dst_mtime = os.stat(str(dst)).st_mtime_ns
+    assert not _smart_write_text(dst, "# title\r\n", read_only=True)
+    assert os.stat(str(dst)).st_mtime_ns == dst_mtime
+
+    # modified contents, with a leftover .new file: overwritten with the new contents
+    (Path(str(tmpdir)) / "dst.md.new").write_text("leftover")
+    assert _smart_write_text(dst, "# modified title\n")
+    assert dst.read_text(encoding="utf-8") == "# modified title\n"
+    assert os.listdir(str(tmpdir)) == ["dst.md"]